@@ -2,7 +2,7 @@
 
 import time
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 import jwt
 
@@ -12,6 +12,9 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# JWT tokens keyed by Admin API key, shared by every AdminAuth in the process
+_token_cache: Dict[str, Tuple[str, datetime]] = {}
+
 
 class AdminAuth:
     """Admin API JWT authentication handler."""
@@ -39,7 +42,9 @@ class AdminAuth:
                 request_id=request_id,
             )
 
-        # Check if we have a valid cached token
+        # Check if we, or another handler with the same key, have a valid cached token
+        if self._cached_token is None and self.api_key in _token_cache:
+            self._cached_token, self._token_expires_at = _token_cache[self.api_key]
         if self._cached_token and self._token_expires_at:
             if datetime.now() < self._token_expires_at - timedelta(seconds=30):
                 logger.debug("Using cached JWT token", request_id=request_id)
@@ -51,6 +56,7 @@ class AdminAuth:
 
         # JWT tokens expire after 5 minutes
         self._token_expires_at = datetime.now() + timedelta(minutes=5)
+        _token_cache[self.api_key] = (token, self._token_expires_at)
 
         logger.debug("Generated new JWT token", request_id=request_id)
         return token
@@ -131,4 +137,6 @@ class AdminAuth:
         """Invalidate cached JWT token to force regeneration."""
         self._cached_token = None
         self._token_expires_at = None
+        if self.api_key:
+            _token_cache.pop(self.api_key, None)
         logger.debug("JWT token cache invalidated")
\ No newline at end of file
@@ -1,6 +1,7 @@
 """Ghost API client with unified interface for Content and Admin APIs."""
 
 import uuid
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
 from urllib.parse import urljoin, urlparse
 
@@ -16,6 +17,31 @@ from .utils.retry import RetryConfig, with_retry
 
 logger = get_logger(__name__)
 
+# Optional process-wide HTTP client reused by every GhostClient instance
+_shared_http_client: Optional[httpx.AsyncClient] = None
+
+
+def set_shared_http_client(
+    client: Optional[httpx.AsyncClient],
+) -> Optional[httpx.AsyncClient]:
+    """Install an HTTP client shared by all GhostClient instances.
+
+    Pass None to clear it. Returns the previously installed client, so callers
+    can restore it afterwards.
+    """
+    global _shared_http_client
+    previous, _shared_http_client = _shared_http_client, client
+    return previous
+
+
+@lru_cache(maxsize=256)
+def _build_url_cached(base_url: str, endpoint: str, api_type: str) -> str:
+    """Join an API endpoint onto a base URL.
+
+    Memoized per (base_url, endpoint, api_type).
+    """
+    return urljoin(base_url, f"ghost/api/{api_type}/{endpoint}")
+
 
 class GhostClient:
     """Unified Ghost API client for both Content and Admin APIs."""
@@ -26,8 +52,13 @@ class GhostClient:
         content_api_key: Optional[str] = None,
         admin_api_key: Optional[str] = None,
         timeout: Optional[int] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
     ) -> None:
-        """Initialize Ghost client with optional configuration overrides."""
+        """Initialize Ghost client with optional configuration overrides.
+
+        ``timeout`` only applies to an HTTP client this instance creates. An
+        ``http_client`` passed in, or the shared client, keeps its own timeout.
+        """
         self.base_url = base_url or str(config.ghost.url)
         self.timeout = timeout or config.ghost.timeout
 
@@ -39,8 +70,10 @@ class GhostClient:
         self.content_auth = ContentAuth(content_api_key)
         self.admin_auth = AdminAuth(admin_api_key)
 
-        # HTTP client configuration
-        self.client = httpx.AsyncClient(
+        # HTTP client configuration; borrowed clients are left open on close()
+        shared_client = http_client or _shared_http_client
+        self._owns_client = shared_client is None
+        self.client = shared_client or httpx.AsyncClient(
             timeout=self.timeout,
             limits=httpx.Limits(max_keepalive_connections=10, max_connections=100),
         )
@@ -61,13 +94,13 @@ class GhostClient:
         await self.close()
 
     async def close(self) -> None:
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Close the HTTP client if this instance created it."""
+        if self._owns_client:
+            await self.client.aclose()
 
     def _build_url(self, endpoint: str, api_type: str = "content") -> str:
         """Build full URL for API endpoint."""
-        api_base = f"ghost/api/{api_type}/"
-        return urljoin(self.base_url, api_base + endpoint)
+        return _build_url_cached(self.base_url, endpoint, api_type)
 
     async def _make_request(
         self,
@@ -1,13 +1,28 @@
 """Content API tools for settings."""
 
 import json
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from fastmcp import FastMCP
 
 from ...client import GhostClient
 
 
+def _dumps(data: Any) -> str:
+    """Serialize a settings payload as compact JSON, keeping unicode unescaped."""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+async def _get_settings_data() -> Dict[str, Any]:
+    """Fetch the public settings response from Ghost Content API as a dict."""
+    async with GhostClient() as client:
+        return await client._make_request(
+            method="GET",
+            endpoint="settings/",
+            api_type="content",
+        )
+
+
 async def get_settings() -> str:
     """
     Get public settings from Ghost Content API.
@@ -16,13 +31,7 @@ async def get_settings() -> str:
         JSON string containing public settings data
     """
     try:
-        async with GhostClient() as client:
-            result = await client._make_request(
-                method="GET",
-                endpoint="settings/",
-                api_type="content",
-            )
-            return json.dumps(result, indent=2, default=str)
+        return _dumps(await _get_settings_data())
 
     except Exception as e:
         return json.dumps({"error": str(e)})
@@ -36,31 +45,26 @@ async def get_site_info() -> str:
         JSON string containing site title, description, URL, and other public info
     """
     try:
-        async with GhostClient() as client:
-            result = await client._make_request(
-                method="GET",
-                endpoint="settings/",
-                api_type="content",
-            )
-
-            # Extract key site information
-            if "settings" in result:
-                settings = result["settings"]
-                site_info = {
-                    "title": settings.get("title"),
-                    "description": settings.get("description"),
-                    "url": settings.get("url"),
-                    "logo": settings.get("logo"),
-                    "icon": settings.get("icon"),
-                    "cover_image": settings.get("cover_image"),
-                    "accent_color": settings.get("accent_color"),
-                    "timezone": settings.get("timezone"),
-                    "lang": settings.get("lang"),
-                    "version": settings.get("version"),
-                }
-                return json.dumps({"site_info": site_info}, indent=2, default=str)
-
-            return json.dumps(result, indent=2, default=str)
+        result = await _get_settings_data()
+
+        # Extract key site information
+        if "settings" in result:
+            settings = result["settings"]
+            site_info = {
+                "title": settings.get("title"),
+                "description": settings.get("description"),
+                "url": settings.get("url"),
+                "logo": settings.get("logo"),
+                "icon": settings.get("icon"),
+                "cover_image": settings.get("cover_image"),
+                "accent_color": settings.get("accent_color"),
+                "timezone": settings.get("timezone"),
+                "lang": settings.get("lang"),
+                "version": settings.get("version"),
+            }
+            return _dumps({"site_info": site_info})
+
+        return _dumps(result)
 
     except Exception as e:
         return json.dumps({"error": str(e)})
@@ -0,0 +1,13 @@
+"""Over-limit strings shared by the post and page validation tests."""
+
+# Just past each limit, as used by the page tests
+LONG_255PLUS = "A" * 256  # Title limit: 255 characters
+LONG_300PLUS = "A" * 301  # Meta title limit: 300 characters
+LONG_500PLUS = "A" * 501  # Meta description limit: 500 characters
+LONG_191PLUS = "A" * 192  # Tag name limit: 191 characters
+
+# Well past each limit, as used by the post tests
+LONG_TITLE_POST = "A" * 300
+LONG_META_TITLE_POST = "A" * 350
+LONG_META_DESC_POST = "A" * 550
+LONG_TAG_POST = "A" * 200
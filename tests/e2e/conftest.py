@@ -1,71 +1,116 @@
 """Fixtures for end-to-end tests."""
 
 import asyncio
+import importlib.util
 import json
+import logging
 import os
+import re
 import uuid
-from typing import AsyncGenerator, Dict, List, Any
+from functools import lru_cache
+from typing import AsyncGenerator, Dict, List, Any, Set
 
 import pytest
 import httpx
 
 from ghost_mcp.server import mcp
-from ghost_mcp.client import GhostClient
+from ghost_mcp.client import GhostClient, set_shared_http_client
 from ghost_mcp.config import config
 
+try:  # orjson is optional; parse tool responses with it when installed
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+try:  # uvloop is optional; run the e2e event loop on it when installed
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# HTTP/2 multiplexing needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+logger = logging.getLogger(__name__)
+
+
+# Without uvloop, pytest-asyncio's own default event loop policy is left in place
+if uvloop is not None:
+
+    @pytest.fixture(scope="session")
+    def event_loop_policy():
+        """Run the e2e event loop on uvloop."""
+        return uvloop.EventLoopPolicy()
+
 
 @pytest.fixture(scope="session")
 def ensure_ghost_running():
-    """Ensure Ghost container is running before tests."""
-    import subprocess
-
+    """Ensure Ghost is reachable before tests, probing it once per session."""
+    # A skip raised here is cached with the fixture, so an unreachable Ghost
+    # skips every e2e test immediately instead of timing out test by test.
     try:
-        # Check if Ghost is accessible
-        response = httpx.get("http://localhost:2368", timeout=5)
-        if response.status_code != 200:
-            raise Exception("Ghost not accessible")
-    except Exception:
-        # Try to start Ghost containers
-        result = subprocess.run(
-            ["docker", "compose", "ps", "-q", "ghost"],
-            capture_output=True,
-            text=True,
-            cwd="/var/home/luiz/projects/thenets/ghost-mcp"
-        )
-
-        if not result.stdout.strip():
-            pytest.skip("Ghost container not running. Run 'make start-ghost' first.")
+        response = httpx.get(str(config.ghost.url), timeout=2)
+    except httpx.HTTPError as e:
+        pytest.skip(f"Ghost unreachable at {config.ghost.url} ({e}). Run 'make start-ghost' first.")
+    if not response.is_success:
+        pytest.skip(f"Ghost at {config.ghost.url} returned HTTP {response.status_code}. Check 'make logs'.")
 
     # Verify environment configuration
     if not os.getenv("GHOST_CONTENT_API_KEY") or not os.getenv("GHOST_ADMIN_API_KEY"):
         pytest.skip("Ghost API keys not configured. Run 'make setup-tokens' first.")
 
 
-@pytest.fixture
-async def ghost_client() -> AsyncGenerator[GhostClient, None]:
-    """Provide a Ghost client for tests."""
+def make_unique_id() -> str:
+    """Return a short id that stays unique across pytest-xdist workers."""
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    return f"{worker}-{str(uuid.uuid4())[:8]}"
+
+
+@pytest.fixture(scope="session")
+async def shared_http_client(ensure_ghost_running) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Provide one pooled HTTP client reused by every Ghost request in the session."""
+    async with httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=config.ghost.timeout,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+    ) as client:
+        # Installed only for e2e tests; the previous shared client comes back on teardown
+        previous = set_shared_http_client(client)
+        yield client
+        set_shared_http_client(previous)
+
+
+@pytest.fixture(scope="session")
+async def ghost_client(shared_http_client) -> AsyncGenerator[GhostClient, None]:
+    """Provide a Ghost client for tests, backed by the shared connection pool."""
     async with GhostClient() as client:
         yield client
 
 
-_tools_registered = False
+@pytest.fixture(scope="session")
+async def warm_ghost(ensure_ghost_running, ghost_client: GhostClient):
+    """Warm the connection pool and Ghost's caches once, before the first e2e test."""
+    # The first request per API otherwise pays the connection and cold-cache cost
+    # inside whichever test happens to run first; failures surface in the tests.
+    await asyncio.gather(
+        ghost_client._make_request("GET", "tags/", params={"limit": 1, "include": "count.posts"}),
+        ghost_client._make_request("GET", "tags/", api_type="admin", params={"limit": 1}),
+        return_exceptions=True,
+    )
 
-@pytest.fixture
-def mcp_server():
-    """Provide the MCP server instance."""
-    global _tools_registered
-    if not _tools_registered:
-        from ghost_mcp.server import register_tools
-        # Ensure tools are registered for testing
-        register_tools()
-        _tools_registered = True
+
+@pytest.fixture(scope="session")
+def mcp_server(shared_http_client):
+    """Provide the MCP server instance, with tools using the shared HTTP client."""
+    from ghost_mcp.server import register_tools
+
+    # Session scope registers the tools exactly once per test run
+    register_tools()
     return mcp
 
 
-@pytest.fixture
-async def test_post_data() -> Dict[str, Any]:
-    """Provide test data for creating posts."""
-    unique_id = str(uuid.uuid4())[:8]
+def make_post_data() -> Dict[str, Any]:
+    """Build a draft Lexical post payload with a unique title."""
+    unique_id = make_unique_id()
     return {
         "title": f"Test Post {unique_id}",
         "content": json.dumps({
@@ -102,10 +147,16 @@ async def test_post_data() -> Dict[str, Any]:
     }
 
 
+@pytest.fixture
+async def test_post_data() -> Dict[str, Any]:
+    """Provide test data for creating posts."""
+    return make_post_data()
+
+
 @pytest.fixture
 async def test_page_data() -> Dict[str, Any]:
     """Provide test data for creating pages."""
-    unique_id = str(uuid.uuid4())[:8]
+    unique_id = make_unique_id()
     return {
         "title": f"Test Page {unique_id}",
         "content": json.dumps({
@@ -145,7 +196,7 @@ async def test_page_data() -> Dict[str, Any]:
 @pytest.fixture
 async def test_tag_data() -> Dict[str, str]:
     """Provide test data for creating tags."""
-    unique_id = str(uuid.uuid4())[:8]
+    unique_id = make_unique_id()
     return {
         "name": f"test-tag-{unique_id}",
         "description": f"Test tag for e2e testing {unique_id}"
@@ -155,18 +206,19 @@ async def test_tag_data() -> Dict[str, str]:
 @pytest.fixture
 async def cleanup_test_content(ghost_client: GhostClient):
     """Clean up test content after each test."""
-    created_posts = []
-    created_pages = []
-    created_tags = []
+    # Sets, so an id tracked twice is only deleted once
+    created_posts: Set[str] = set()
+    created_pages: Set[str] = set()
+    created_tags: Set[str] = set()
 
     def track_post(post_id: str):
-        created_posts.append(post_id)
+        created_posts.add(post_id)
 
     def track_page(page_id: str):
-        created_pages.append(page_id)
+        created_pages.add(page_id)
 
     def track_tag(tag_id: str):
-        created_tags.append(tag_id)
+        created_tags.add(tag_id)
 
     # Provide tracking functions
     yield {
@@ -175,24 +227,23 @@ async def cleanup_test_content(ghost_client: GhostClient):
         "track_tag": track_tag
     }
 
-    # Cleanup after test
-    for post_id in created_posts:
-        try:
-            await ghost_client._make_request("DELETE", f"posts/{post_id}/", api_type="admin")
-        except Exception:
-            pass  # Ignore cleanup errors
-
-    for page_id in created_pages:
-        try:
-            await ghost_client._make_request("DELETE", f"pages/{page_id}/", api_type="admin")
-        except Exception:
-            pass  # Ignore cleanup errors
-
-    for tag_id in created_tags:
-        try:
-            await ghost_client._make_request("DELETE", f"tags/{tag_id}/", api_type="admin")
-        except Exception:
-            pass  # Ignore cleanup errors
+    # Cleanup after test; delete everything concurrently and log cleanup errors
+    targets = [
+        f"{resource}/{item_id}/"
+        for resource, item_ids in (
+            ("posts", created_posts),
+            ("pages", created_pages),
+            ("tags", created_tags),
+        )
+        for item_id in item_ids
+    ]
+    results = await asyncio.gather(
+        *(ghost_client._make_request("DELETE", target, api_type="admin") for target in targets),
+        return_exceptions=True,
+    )
+    for target, result in zip(targets, results):
+        if isinstance(result, Exception):
+            logger.warning("Failed to clean up %s: %s", target, result)
 
 
 @pytest.fixture
@@ -212,24 +263,27 @@ async def sample_post(ghost_client: GhostClient, test_post_data: Dict[str, Any],
     return post_data
 
 
-@pytest.fixture
-async def sample_published_post(ghost_client: GhostClient, test_post_data: Dict[str, Any], cleanup_test_content):
-    """Create a sample published post for testing."""
-    # Modify data for published post
-    test_post_data["status"] = "published"
+@pytest.fixture(scope="session")
+async def sample_published_post(ghost_client: GhostClient, ensure_ghost_running) -> AsyncGenerator[Dict[str, Any], None]:
+    """Create one published post shared by the read-only tests of the session."""
+    post_data = make_post_data()
+    post_data["status"] = "published"
 
     # Create a published post
     response = await ghost_client._make_request(
         "POST",
         "posts/",
         api_type="admin",
-        json_data={"posts": [test_post_data]}
+        json_data={"posts": [post_data]}
     )
 
-    post_data = response["posts"][0]
-    cleanup_test_content["track_post"](post_data["id"])
+    post = response["posts"][0]
+    yield post
 
-    return post_data
+    try:
+        await ghost_client._make_request("DELETE", f"posts/{post['id']}/", api_type="admin")
+    except Exception:
+        pass  # Ignore cleanup errors
 
 
 @pytest.fixture
@@ -266,22 +320,48 @@ async def sample_tag(ghost_client: GhostClient, test_tag_data: Dict[str, str], c
     return tag_data
 
 
+@lru_cache(maxsize=None)
+def _token_pattern(tokens: tuple, flags: int = 0) -> re.Pattern:
+    """Compile tokens into one pattern that matches text containing all of them.
+
+    A token tuple matches when any of its alternatives is present. Patterns are
+    cached, so each case table row is compiled once per session.
+    """
+    lookaheads = "".join(
+        "(?=.*{})".format(
+            re.escape(token) if isinstance(token, str)
+            else "(?:{})".format("|".join(map(re.escape, token)))
+        )
+        for token in tokens
+    )
+    return re.compile(lookaheads, flags | re.DOTALL)
+
+
 @pytest.mark.e2e
 class BaseE2ETest:
     """Base class for e2e tests."""
 
     @pytest.fixture(autouse=True)
-    def setup_test(self, ensure_ghost_running):
-        """Auto-use the Ghost running check."""
+    def setup_test(self, ensure_ghost_running, shared_http_client, warm_ghost):
+        """Auto-use the Ghost running check, shared HTTP client and session warm-up."""
         pass
 
+    # Resolved tools keyed by (server id, tool name), shared by all e2e tests
+    _tool_cache: Dict[tuple, Any] = {}
+
     async def get_mcp_tool(self, mcp_server, tool_name: str):
-        """Get an MCP tool by name from the server."""
+        """Get an MCP tool by name from the server, resolving it only once."""
+        key = (id(mcp_server), tool_name)
+        tool = self._tool_cache.get(key)
+        if tool is not None:
+            return tool
+
         tools = await mcp_server.get_tools()
         if tool_name not in tools:
             available_tools = list(tools.keys())
             raise ValueError(f"Tool '{tool_name}' not found. Available tools: {available_tools}")
-        return tools[tool_name]
+        tool = self._tool_cache[key] = tools[tool_name]
+        return tool
 
     async def call_mcp_tool(self, mcp_server, tool_name: str, **kwargs):
         """Call an MCP tool with the given arguments."""
@@ -294,4 +374,25 @@ class BaseE2ETest:
             return result.content[0]
         elif hasattr(result, 'content'):
             return result.content
-        return result
\ No newline at end of file
+        return result
+
+    async def call_mcp_tool_json(self, mcp_server, tool_name: str, **kwargs) -> Dict[str, Any]:
+        """Call an MCP tool and parse its JSON text response."""
+        return json_loads(await self.call_mcp_tool(mcp_server, tool_name, **kwargs))
+
+    @staticmethod
+    def assert_validation_error(response: Dict[str, Any], err_tokens=(), ctx_tokens=None, case_id=None):
+        """Assert a tool response is an error mentioning the given tokens.
+
+        A token tuple matches when any of its alternatives is present. Error tokens
+        are matched case-insensitively, context tokens exactly. ``ctx_tokens=None``
+        skips the context check and ``()`` only requires a context to be present.
+        ``case_id`` labels failure messages, e.g. for one row of a batched case table.
+        """
+        assert "error" in response, (case_id, response)
+        assert _token_pattern(tuple(err_tokens), re.IGNORECASE).search(response["error"]), (
+            case_id, err_tokens, response,
+        )
+        if ctx_tokens is not None:
+            assert "context" in response, (case_id, response)
+            assert _token_pattern(tuple(ctx_tokens)).search(response["context"]), (case_id, ctx_tokens, response)
@@ -1,19 +1,24 @@
 """End-to-end tests for Ghost authors functionality."""
 
 import json
+import re
+
 import pytest
 
+from ghost_mcp.tools.content.authors import get_author_by_id, get_author_by_slug, get_authors
+
 from .conftest import BaseE2ETest
 
+# Error messages accepted for lookups of missing or invalid authors
+_MISSING_PATTERN = re.compile(r"not found|404|validation error", re.IGNORECASE)
+
 
 @pytest.mark.e2e
 class TestAuthorsContentAPIE2E(BaseE2ETest):
     """Test authors Content API functionality end-to-end."""
 
-    async def test_get_authors(self, mcp_server):
+    async def test_get_authors(self):
         """Test getting authors."""
-        from ghost_mcp.tools.content.authors import get_authors
-
         # Get authors
         result = await get_authors()
         response = json.loads(result)
@@ -33,10 +38,8 @@ class TestAuthorsContentAPIE2E(BaseE2ETest):
             for field in essential_fields:
                 assert field in author
 
-    async def test_get_authors_with_pagination(self, mcp_server):
+    async def test_get_authors_with_pagination(self):
         """Test getting authors with pagination parameters."""
-        from ghost_mcp.tools.content.authors import get_authors
-
         # Get authors with limit
         result = await get_authors(limit=5)
         response = json.loads(result)
@@ -48,10 +51,8 @@ class TestAuthorsContentAPIE2E(BaseE2ETest):
         assert "meta" in response
         assert "pagination" in response["meta"]
 
-    async def test_get_authors_with_include_count(self, mcp_server):
+    async def test_get_authors_with_include_count(self):
         """Test getting authors with post count included."""
-        from ghost_mcp.tools.content.authors import get_authors
-
         # Get authors with count.posts included
         result = await get_authors(include="count.posts")
         response = json.loads(result)
@@ -63,10 +64,8 @@ class TestAuthorsContentAPIE2E(BaseE2ETest):
             assert "posts" in author["count"]
             assert isinstance(author["count"]["posts"], int)
 
-    async def test_get_authors_with_filter(self, mcp_server):
+    async def test_get_authors_with_filter(self):
         """Test getting authors with filter."""
-        from ghost_mcp.tools.content.authors import get_authors
-
         # Filter authors by status
         result = await get_authors(filter="status:active")
         response = json.loads(result)
@@ -79,10 +78,8 @@ class TestAuthorsContentAPIE2E(BaseE2ETest):
                 status = author.get("status", "active")
                 assert status == "active"
 
-    async def test_get_authors_with_order(self, mcp_server):
+    async def test_get_authors_with_order(self):
         """Test getting authors with custom ordering."""
-        from ghost_mcp.tools.content.authors import get_authors
-
         # Get authors ordered by name
         result = await get_authors(order="name asc")
         response = json.loads(result)
@@ -92,10 +89,8 @@ class TestAuthorsContentAPIE2E(BaseE2ETest):
             author_names = [author["name"] for author in response["authors"]]
             assert author_names == sorted(author_names)
 
-    async def test_get_author_by_id(self, mcp_server):
+    async def test_get_author_by_id(self):
         """Test getting an author by ID."""
-        from ghost_mcp.tools.content.authors import get_authors, get_author_by_id
-
         # First get all authors to find an existing ID
         all_authors_result = await get_authors()
         all_authors_response = json.loads(all_authors_result)
@@ -119,10 +114,8 @@ class TestAuthorsContentAPIE2E(BaseE2ETest):
         assert author["id"] == author_id
         assert author["name"] == test_author["name"]
 
-    async def test_get_author_by_slug(self, mcp_server):
+    async def test_get_author_by_slug(self):
         """Test getting an author by slug."""
-        from ghost_mcp.tools.content.authors import get_authors, get_author_by_slug
-
         # First get all authors to find an existing slug
         all_authors_result = await get_authors()
         all_authors_response = json.loads(all_authors_result)
@@ -146,34 +139,26 @@ class TestAuthorsContentAPIE2E(BaseE2ETest):
         assert author["slug"] == author_slug
         assert author["name"] == test_author["name"]
 
-    async def test_get_author_by_nonexistent_id(self, mcp_server):
+    async def test_get_author_by_nonexistent_id(self):
         """Test getting an author with non-existent ID returns proper error."""
-        from ghost_mcp.tools.content.authors import get_author_by_id
-
         result = await get_author_by_id("nonexistent-id")
         response = json.loads(result)
 
         # Should return an error response
         assert "error" in response
-        error_msg = response["error"].lower()
-        assert "not found" in error_msg or "404" in error_msg or "resource not found" in error_msg or "validation error" in error_msg
+        assert _MISSING_PATTERN.search(response["error"])
 
-    async def test_get_author_by_nonexistent_slug(self, mcp_server):
+    async def test_get_author_by_nonexistent_slug(self):
         """Test getting an author with non-existent slug returns proper error."""
-        from ghost_mcp.tools.content.authors import get_author_by_slug
-
         result = await get_author_by_slug("nonexistent-slug")
         response = json.loads(result)
 
         # Should return an error response
         assert "error" in response
-        error_msg = response["error"].lower()
-        assert "not found" in error_msg or "404" in error_msg or "resource not found" in error_msg or "validation error" in error_msg
+        assert _MISSING_PATTERN.search(response["error"])
 
-    async def test_author_fields_structure(self, mcp_server):
+    async def test_author_fields_structure(self):
         """Test that authors have expected field structure."""
-        from ghost_mcp.tools.content.authors import get_authors
-
         # Get authors
         result = await get_authors()
         response = json.loads(result)
@@ -196,10 +181,9 @@ class TestAuthorsContentAPIE2E(BaseE2ETest):
         assert isinstance(author["slug"], str)
         assert isinstance(author["url"], str)
 
-    async def test_author_with_posts_count(self, mcp_server, sample_published_post):
+    @pytest.mark.usefixtures("sample_published_post")
+    async def test_author_with_posts_count(self):
         """Test author post count when author has posts."""
-        from ghost_mcp.tools.content.authors import get_authors
-
         # Get authors with post count
         result = await get_authors(include="count.posts")
         response = json.loads(result)
@@ -219,10 +203,8 @@ class TestAuthorsContentAPIE2E(BaseE2ETest):
         author_with_posts = authors_with_posts[0]
         assert author_with_posts["count"]["posts"] > 0
 
-    async def test_author_profile_fields(self, mcp_server):
+    async def test_author_profile_fields(self):
         """Test that authors include profile-related fields."""
-        from ghost_mcp.tools.content.authors import get_authors
-
         # Get authors
         result = await get_authors()
         response = json.loads(result)
@@ -241,10 +223,8 @@ class TestAuthorsContentAPIE2E(BaseE2ETest):
         for field in profile_fields:
             assert field in author
 
-    async def test_default_ghost_author_exists(self, mcp_server):
+    async def test_default_ghost_author_exists(self):
         """Test that the default Ghost author exists."""
-        from ghost_mcp.tools.content.authors import get_authors
-
         # Get all authors
         result = await get_authors()
         response = json.loads(result)
@@ -261,10 +241,8 @@ class TestAuthorsContentAPIE2E(BaseE2ETest):
         # There should be at least one Ghost-related author
         assert len(ghost_authors) >= 1
 
-    async def test_author_url_format(self, mcp_server):
+    async def test_author_url_format(self):
         """Test that author URLs follow expected format."""
-        from ghost_mcp.tools.content.authors import get_authors
-
         # Get authors
         result = await get_authors()
         response = json.loads(result)
@@ -281,10 +259,8 @@ class TestAuthorsContentAPIE2E(BaseE2ETest):
         assert "/author/" in author_url
         assert author["slug"] in author_url
 
-    async def test_authors_unique_slugs(self, mcp_server):
+    async def test_authors_unique_slugs(self):
         """Test that all authors have unique slugs."""
-        from ghost_mcp.tools.content.authors import get_authors
-
         # Get all authors
         result = await get_authors()
         response = json.loads(result)
@@ -298,7 +274,7 @@ class TestAuthorsContentAPIE2E(BaseE2ETest):
         # Verify uniqueness
         assert len(slugs) == len(set(slugs)), "Author slugs are not unique"
 
-    async def test_authors_unique_emails(self, mcp_server):
+    async def test_authors_unique_emails(self):
         """Test that all authors have unique email addresses."""
         # Skip this test since Content API doesn't expose author emails
         pytest.skip("Content API doesn't expose author email addresses")
\ No newline at end of file
@@ -1,64 +1,429 @@
 """End-to-end tests for Ghost posts functionality."""
 
+import asyncio
 import json
+import re
+
 import pytest
 
-from .conftest import BaseE2ETest
+from .conftest import BaseE2ETest, json_loads
 
+# Keep every posts test on one xdist worker under ``--dist=loadgroup``
+pytestmark = [pytest.mark.e2e, pytest.mark.xdist_group("ghost-posts")]
 
-@pytest.mark.e2e
-class TestPostsContentAPIE2E(BaseE2ETest):
-    """Test posts Content API functionality end-to-end."""
+# Error messages accepted for lookups and writes against missing posts
+_NOT_FOUND_PATTERN = re.compile(r"not found", re.IGNORECASE)
+_MISSING_PATTERN = re.compile(r"not found|validation|422", re.IGNORECASE)
+# Ghost rejects some updates without the current updated_at
+_UPDATE_REJECTED_PATTERN = re.compile(r"validation|updated_at", re.IGNORECASE)
 
-    async def test_get_posts(self, mcp_server, sample_published_post):
-        """Test getting published posts."""
-        # Get posts
-        result = await self.call_mcp_tool(mcp_server, "get_posts")
-        response = json.loads(result)
+# Static Lexical payloads, serialized once at import time
+_COMPLEX_TITLE = "Using Playwright MCP Server with Google Chrome Flatpak on Linux"
+_COMPLEX_CONTENT = json.dumps({
+    "root": {
+        "children": [
+            {
+                "children": [
+                    {
+                        "detail": 0,
+                        "format": 0,
+                        "mode": "normal",
+                        "style": "",
+                        "text": "Using Playwright MCP Server with Google Chrome Flatpak on Linux",
+                        "type": "text",
+                        "version": 1
+                    }
+                ],
+                "direction": "ltr",
+                "format": "",
+                "indent": 0,
+                "type": "heading",
+                "version": 1,
+                "tag": "h1"
+            },
+            {
+                "children": [
+                    {
+                        "detail": 0,
+                        "format": 0,
+                        "mode": "normal",
+                        "style": "",
+                        "text": "The Model Context Protocol (MCP) has revolutionized how AI assistants interact with external tools and services. One particularly powerful integration is the ",
+                        "type": "text",
+                        "version": 1
+                    },
+                    {
+                        "detail": 0,
+                        "format": 0,
+                        "mode": "normal",
+                        "style": "",
+                        "text": "Playwright MCP server",
+                        "type": "link",
+                        "url": "https://github.com/microsoft/playwright-mcp",
+                        "version": 1
+                    },
+                    {
+                        "detail": 0,
+                        "format": 0,
+                        "mode": "normal",
+                        "style": "",
+                        "text": ", which enables AI to control web browsers for automation tasks.",
+                        "type": "text",
+                        "version": 1
+                    }
+                ],
+                "direction": "ltr",
+                "format": "",
+                "indent": 0,
+                "type": "paragraph",
+                "version": 1
+            },
+            {
+                "children": [
+                    {
+                        "detail": 0,
+                        "format": 0,
+                        "mode": "normal",
+                        "style": "",
+                        "text": "The Simple Solution",
+                        "type": "text",
+                        "version": 1
+                    }
+                ],
+                "direction": "ltr",
+                "format": "",
+                "indent": 0,
+                "type": "heading",
+                "version": 1,
+                "tag": "h2"
+            },
+            {
+                "children": [
+                    {
+                        "detail": 0,
+                        "format": 0,
+                        "mode": "normal",
+                        "style": "",
+                        "text": "Instead of complex configurations, we'll use a two-step approach:",
+                        "type": "text",
+                        "version": 1
+                    }
+                ],
+                "direction": "ltr",
+                "format": "",
+                "indent": 0,
+                "type": "paragraph",
+                "version": 1
+            },
+            {
+                "children": [
+                    {
+                        "children": [
+                            {
+                                "detail": 0,
+                                "format": 0,
+                                "mode": "normal",
+                                "style": "",
+                                "text": "Install Google Chrome from Flathub",
+                                "type": "text",
+                                "version": 1
+                            }
+                        ],
+                        "direction": "ltr",
+                        "format": "",
+                        "indent": 0,
+                        "type": "listitem",
+                        "version": 1,
+                        "value": 1
+                    },
+                    {
+                        "children": [
+                            {
+                                "detail": 0,
+                                "format": 0,
+                                "mode": "normal",
+                                "style": "",
+                                "text": "Create a symbolic link that Playwright expects",
+                                "type": "text",
+                                "version": 1
+                            }
+                        ],
+                        "direction": "ltr",
+                        "format": "",
+                        "indent": 0,
+                        "type": "listitem",
+                        "version": 1,
+                        "value": 2
+                    }
+                ],
+                "direction": "ltr",
+                "format": "",
+                "indent": 0,
+                "type": "list",
+                "version": 1,
+                "listType": "number",
+                "start": 1
+            },
+            {
+                "children": [
+                    {
+                        "detail": 0,
+                        "format": 0,
+                        "mode": "normal",
+                        "style": "",
+                        "text": "Step 1: Install Google Chrome",
+                        "type": "text",
+                        "version": 1
+                    }
+                ],
+                "direction": "ltr",
+                "format": "",
+                "indent": 0,
+                "type": "heading",
+                "version": 1,
+                "tag": "h2"
+            },
+            {
+                "children": [
+                    {
+                        "detail": 0,
+                        "format": 0,
+                        "mode": "normal",
+                        "style": "",
+                        "text": "First, install Google Chrome using Flatpak:",
+                        "type": "text",
+                        "version": 1
+                    }
+                ],
+                "direction": "ltr",
+                "format": "",
+                "indent": 0,
+                "type": "paragraph",
+                "version": 1
+            },
+            {
+                "children": [
+                    {
+                        "detail": 0,
+                        "format": 0,
+                        "mode": "normal",
+                        "style": "",
+                        "text": "flatpak install flathub com.google.Chrome",
+                        "type": "text",
+                        "version": 1
+                    }
+                ],
+                "direction": "ltr",
+                "format": "",
+                "indent": 0,
+                "type": "code",
+                "version": 1,
+                "language": "bash"
+            },
+            {
+                "children": [
+                    {
+                        "detail": 0,
+                        "format": 0,
+                        "mode": "normal",
+                        "style": "",
+                        "text": "Conclusion",
+                        "type": "text",
+                        "version": 1
+                    }
+                ],
+                "direction": "ltr",
+                "format": "",
+                "indent": 0,
+                "type": "heading",
+                "version": 1,
+                "tag": "h2"
+            },
+            {
+                "children": [
+                    {
+                        "detail": 0,
+                        "format": 0,
+                        "mode": "normal",
+                        "style": "",
+                        "text": "This simple solution eliminates complexity and combines Flatpak security with Playwright simplicity.",
+                        "type": "text",
+                        "version": 1
+                    }
+                ],
+                "direction": "ltr",
+                "format": "",
+                "indent": 0,
+                "type": "paragraph",
+                "version": 1
+            }
+        ],
+        "direction": "ltr",
+        "format": "",
+        "indent": 0,
+        "type": "root",
+        "version": 1
+    }
+})
+
+_VERIFY_LEXICAL_TITLE = "Content Verification Test - Lexical"
+_VERIFY_LEXICAL_CONTENT = json.dumps({
+    "root": {
+        "children": [
+            {
+                "children": [
+                    {
+                        "detail": 0,
+                        "format": 0,
+                        "mode": "normal",
+                        "style": "",
+                        "text": "Test Heading for Verification",
+                        "type": "text",
+                        "version": 1
+                    }
+                ],
+                "direction": "ltr",
+                "format": "",
+                "indent": 0,
+                "type": "heading",
+                "version": 1,
+                "tag": "h2"
+            },
+            {
+                "children": [
+                    {
+                        "detail": 0,
+                        "format": 0,
+                        "mode": "normal",
+                        "style": "",
+                        "text": "This is a test paragraph with ",
+                        "type": "text",
+                        "version": 1
+                    },
+                    {
+                        "detail": 0,
+                        "format": 0,
+                        "mode": "normal",
+                        "style": "",
+                        "text": "a test link",
+                        "type": "link",
+                        "url": "https://example.com/test",
+                        "version": 1
+                    },
+                    {
+                        "detail": 0,
+                        "format": 0,
+                        "mode": "normal",
+                        "style": "",
+                        "text": " for content verification.",
+                        "type": "text",
+                        "version": 1
+                    }
+                ],
+                "direction": "ltr",
+                "format": "",
+                "indent": 0,
+                "type": "paragraph",
+                "version": 1
+            }
+        ],
+        "direction": "ltr",
+        "format": "",
+        "indent": 0,
+        "type": "root",
+        "version": 1
+    }
+})
+
+_SPECIAL_TITLE = "Test Post with Special Characters: éñ中文 🚀"
+_SPECIAL_CONTENT = json.dumps({
+    "root": {
+        "children": [
+            {
+                "children": [
+                    {
+                        "detail": 0,
+                        "format": 0,
+                        "mode": "normal",
+                        "style": "",
+                        "text": "Content with émojis 🎉 and unicode: 中文字符",
+                        "type": "text",
+                        "version": 1
+                    }
+                ],
+                "direction": "ltr",
+                "format": "",
+                "indent": 0,
+                "type": "paragraph",
+                "version": 1
+            }
+        ],
+        "direction": "ltr",
+        "format": "",
+        "indent": 0,
+        "type": "root",
+        "version": 1
+    }
+})
 
-        # Verify response structure
-        assert "posts" in response
-        assert "meta" in response
-        assert isinstance(response["posts"], list)
 
-        # Verify our test post appears in the list
-        post_titles = [post["title"] for post in response["posts"]]
-        assert sample_published_post["title"] in post_titles
+def _assert_posts_response(response: dict, count: int | None = None, meta: bool = False) -> None:
+    """Assert the shared posts response envelope, optionally its size and meta."""
+    assert isinstance(response.get("posts"), list)
+    if count is not None:
+        assert len(response["posts"]) == count
+    if meta:
+        assert isinstance(response.get("meta"), dict)
 
-    async def test_get_posts_with_pagination(self, mcp_server):
-        """Test getting posts with pagination parameters."""
-        # Get posts with limit
-        result = await self.call_mcp_tool(mcp_server, "get_posts", limit=5)
-        response = json.loads(result)
 
-        assert "posts" in response
-        assert len(response["posts"]) <= 5
+def _check_lists_sample_post(response: dict, sample_post: dict) -> None:
+    """Check a default get_posts response lists the sample post."""
+    _assert_posts_response(response, meta=True)
+    assert sample_post["id"] in {post["id"] for post in response["posts"]}
 
-        # Test pagination metadata
-        assert "meta" in response
-        assert "pagination" in response["meta"]
 
-    async def test_get_posts_with_include_fields(self, mcp_server):
-        """Test getting posts with include fields."""
-        # Get posts with tags and authors included
-        result = await self.call_mcp_tool(mcp_server, "get_posts", include="tags,authors")
-        response = json.loads(result)
+def _check_paginated(response: dict, sample_post: dict) -> None:
+    """Check a get_posts response honours limit=5 and carries pagination."""
+    _assert_posts_response(response, meta=True)
+    assert len(response["posts"]) <= 5
+    assert "pagination" in response["meta"]
 
-        # Verify posts include tags and authors
-        if response["posts"]:
-            post = response["posts"][0]
-            assert "tags" in post
-            assert "authors" in post
+
+def _check_includes_tags_and_authors(response: dict, sample_post: dict) -> None:
+    """Check a get_posts response includes tags and authors."""
+    _assert_posts_response(response)
+    assert response["posts"], "the sample published post should be listed"
+    post = response["posts"][0]
+    assert "tags" in post
+    assert "authors" in post
+
+
+@pytest.mark.e2e
+class TestPostsContentAPIE2E(BaseE2ETest):
+    """Test posts Content API functionality end-to-end."""
+
+    @pytest.mark.parametrize(
+        ("kwargs", "check"),
+        [
+            ({}, _check_lists_sample_post),
+            ({"limit": 5}, _check_paginated),
+            ({"include": "tags,authors"}, _check_includes_tags_and_authors),
+        ],
+        ids=["default", "pagination", "include_fields"],
+    )
+    async def test_get_posts(self, mcp_server, sample_published_post, kwargs, check):
+        """Test getting published posts with different query parameters."""
+        result = await self.call_mcp_tool(mcp_server, "get_posts", **kwargs)
+        check(json_loads(result), sample_published_post)
 
     async def test_get_post_by_id(self, mcp_server, sample_published_post):
         """Test getting a post by ID."""
         # Get post by ID
         result = await self.call_mcp_tool(mcp_server, "get_post_by_id", post_id=sample_published_post["id"])
-        response = json.loads(result)
+        response = json_loads(result)
 
         # Verify response
-        assert "posts" in response
-        assert len(response["posts"]) == 1
+        _assert_posts_response(response, count=1)
 
         post = response["posts"][0]
         assert post["id"] == sample_published_post["id"]
@@ -68,11 +433,10 @@ class TestPostsContentAPIE2E(BaseE2ETest):
         """Test getting a post by slug."""
         # Get post by slug
         result = await self.call_mcp_tool(mcp_server, "get_post_by_slug", slug=sample_published_post["slug"])
-        response = json.loads(result)
+        response = json_loads(result)
 
         # Verify response
-        assert "posts" in response
-        assert len(response["posts"]) == 1
+        _assert_posts_response(response, count=1)
 
         post = response["posts"][0]
         assert post["slug"] == sample_published_post["slug"]
@@ -85,37 +449,48 @@ class TestPostsContentAPIE2E(BaseE2ETest):
 
         # Search for posts
         result = await self.call_mcp_tool(mcp_server, "search_posts", query=search_term)
-        response = json.loads(result)
+        response = json_loads(result)
 
         # Verify response
-        assert "posts" in response
-        assert isinstance(response["posts"], list)
+        _assert_posts_response(response)
 
         # Verify our test post appears in search results
         if response["posts"]:
-            post_titles = [post["title"] for post in response["posts"]]
-            matching_posts = [title for title in post_titles if search_term in title]
-            assert len(matching_posts) > 0
+            term_lower = search_term.lower()
+            assert any(term_lower in post["title"].lower() for post in response["posts"])
+
+    async def test_read_only_tools_concurrently(self, mcp_server, sample_published_post):
+        """Test issuing independent read-only post tools concurrently."""
+        results = await asyncio.gather(
+            self.call_mcp_tool(mcp_server, "get_posts", limit=5),
+            self.call_mcp_tool(mcp_server, "get_posts", include="tags,authors"),
+            self.call_mcp_tool(mcp_server, "get_post_by_id", post_id=sample_published_post["id"]),
+            self.call_mcp_tool(mcp_server, "get_post_by_slug", slug=sample_published_post["slug"]),
+        )
+        paginated, included, by_id, by_slug = (json_loads(result) for result in results)
 
-    async def test_get_post_by_nonexistent_id(self, mcp_server):
-        """Test getting a post with non-existent ID returns proper error."""
-        result = await self.call_mcp_tool(mcp_server, "get_post_by_id", post_id="nonexistent-id")
+        assert len(paginated["posts"]) <= 5
+        assert "pagination" in paginated["meta"]
 
-        # MCP tools return JSON error responses instead of raising exceptions
-        response = json.loads(result)
-        assert "error" in response
-        assert ("not found" in response["error"].lower() or
-                "validation error" in response["error"].lower())
+        if included["posts"]:
+            assert "tags" in included["posts"][0]
+            assert "authors" in included["posts"][0]
+
+        assert by_id["posts"][0]["id"] == sample_published_post["id"]
+        assert by_slug["posts"][0]["slug"] == sample_published_post["slug"]
 
-    async def test_get_post_by_nonexistent_slug(self, mcp_server):
-        """Test getting a post with non-existent slug returns proper error."""
-        result = await self.call_mcp_tool(mcp_server, "get_post_by_slug", slug="nonexistent-slug")
+    @pytest.mark.parametrize(("tool_name", "kwargs"), [
+        ("get_post_by_id", {"post_id": "nonexistent-id"}),
+        ("get_post_by_slug", {"slug": "nonexistent-slug"}),
+    ])
+    async def test_get_nonexistent_post(self, mcp_server, tool_name, kwargs):
+        """Test looking up a non-existent post returns proper error."""
+        result = await self.call_mcp_tool(mcp_server, tool_name, **kwargs)
 
         # MCP tools return JSON error responses instead of raising exceptions
-        response = json.loads(result)
+        response = json_loads(result)
         assert "error" in response
-        assert ("not found" in response["error"].lower() or
-                "validation error" in response["error"].lower())
+        assert _MISSING_PATTERN.search(response["error"])
 
 
 @pytest.mark.e2e
@@ -133,11 +508,10 @@ class TestPostsAdminAPIE2E(BaseE2ETest):
             content_format=test_post_data["content_format"],
             status=test_post_data["status"]
         )
-        response = json.loads(result)
+        response = json_loads(result)
 
         # Verify response
-        assert "posts" in response
-        assert len(response["posts"]) == 1
+        _assert_posts_response(response, count=1)
 
         post = response["posts"][0]
         assert post["title"] == test_post_data["title"]
@@ -147,262 +521,13 @@ class TestPostsAdminAPIE2E(BaseE2ETest):
         # Track for cleanup
         cleanup_test_content["track_post"](post["id"])
 
-    async def test_create_post_published(self, mcp_server, test_post_data, cleanup_test_content):
+    async def test_create_post_published(self, mcp_server, cleanup_test_content):
         """Test creating a published post with complex content."""
-        # Complex post content based on the template in Lexical format
-        complex_title = "Using Playwright MCP Server with Google Chrome Flatpak on Linux"
-        complex_content = json.dumps({
-            "root": {
-                "children": [
-                    {
-                        "children": [
-                            {
-                                "detail": 0,
-                                "format": 0,
-                                "mode": "normal",
-                                "style": "",
-                                "text": "Using Playwright MCP Server with Google Chrome Flatpak on Linux",
-                                "type": "text",
-                                "version": 1
-                            }
-                        ],
-                        "direction": "ltr",
-                        "format": "",
-                        "indent": 0,
-                        "type": "heading",
-                        "version": 1,
-                        "tag": "h1"
-                    },
-                    {
-                        "children": [
-                            {
-                                "detail": 0,
-                                "format": 0,
-                                "mode": "normal",
-                                "style": "",
-                                "text": "The Model Context Protocol (MCP) has revolutionized how AI assistants interact with external tools and services. One particularly powerful integration is the ",
-                                "type": "text",
-                                "version": 1
-                            },
-                            {
-                                "detail": 0,
-                                "format": 0,
-                                "mode": "normal",
-                                "style": "",
-                                "text": "Playwright MCP server",
-                                "type": "link",
-                                "url": "https://github.com/microsoft/playwright-mcp",
-                                "version": 1
-                            },
-                            {
-                                "detail": 0,
-                                "format": 0,
-                                "mode": "normal",
-                                "style": "",
-                                "text": ", which enables AI to control web browsers for automation tasks.",
-                                "type": "text",
-                                "version": 1
-                            }
-                        ],
-                        "direction": "ltr",
-                        "format": "",
-                        "indent": 0,
-                        "type": "paragraph",
-                        "version": 1
-                    },
-                    {
-                        "children": [
-                            {
-                                "detail": 0,
-                                "format": 0,
-                                "mode": "normal",
-                                "style": "",
-                                "text": "The Simple Solution",
-                                "type": "text",
-                                "version": 1
-                            }
-                        ],
-                        "direction": "ltr",
-                        "format": "",
-                        "indent": 0,
-                        "type": "heading",
-                        "version": 1,
-                        "tag": "h2"
-                    },
-                    {
-                        "children": [
-                            {
-                                "detail": 0,
-                                "format": 0,
-                                "mode": "normal",
-                                "style": "",
-                                "text": "Instead of complex configurations, we'll use a two-step approach:",
-                                "type": "text",
-                                "version": 1
-                            }
-                        ],
-                        "direction": "ltr",
-                        "format": "",
-                        "indent": 0,
-                        "type": "paragraph",
-                        "version": 1
-                    },
-                    {
-                        "children": [
-                            {
-                                "children": [
-                                    {
-                                        "detail": 0,
-                                        "format": 0,
-                                        "mode": "normal",
-                                        "style": "",
-                                        "text": "Install Google Chrome from Flathub",
-                                        "type": "text",
-                                        "version": 1
-                                    }
-                                ],
-                                "direction": "ltr",
-                                "format": "",
-                                "indent": 0,
-                                "type": "listitem",
-                                "version": 1,
-                                "value": 1
-                            },
-                            {
-                                "children": [
-                                    {
-                                        "detail": 0,
-                                        "format": 0,
-                                        "mode": "normal",
-                                        "style": "",
-                                        "text": "Create a symbolic link that Playwright expects",
-                                        "type": "text",
-                                        "version": 1
-                                    }
-                                ],
-                                "direction": "ltr",
-                                "format": "",
-                                "indent": 0,
-                                "type": "listitem",
-                                "version": 1,
-                                "value": 2
-                            }
-                        ],
-                        "direction": "ltr",
-                        "format": "",
-                        "indent": 0,
-                        "type": "list",
-                        "version": 1,
-                        "listType": "number",
-                        "start": 1
-                    },
-                    {
-                        "children": [
-                            {
-                                "detail": 0,
-                                "format": 0,
-                                "mode": "normal",
-                                "style": "",
-                                "text": "Step 1: Install Google Chrome",
-                                "type": "text",
-                                "version": 1
-                            }
-                        ],
-                        "direction": "ltr",
-                        "format": "",
-                        "indent": 0,
-                        "type": "heading",
-                        "version": 1,
-                        "tag": "h2"
-                    },
-                    {
-                        "children": [
-                            {
-                                "detail": 0,
-                                "format": 0,
-                                "mode": "normal",
-                                "style": "",
-                                "text": "First, install Google Chrome using Flatpak:",
-                                "type": "text",
-                                "version": 1
-                            }
-                        ],
-                        "direction": "ltr",
-                        "format": "",
-                        "indent": 0,
-                        "type": "paragraph",
-                        "version": 1
-                    },
-                    {
-                        "children": [
-                            {
-                                "detail": 0,
-                                "format": 0,
-                                "mode": "normal",
-                                "style": "",
-                                "text": "flatpak install flathub com.google.Chrome",
-                                "type": "text",
-                                "version": 1
-                            }
-                        ],
-                        "direction": "ltr",
-                        "format": "",
-                        "indent": 0,
-                        "type": "code",
-                        "version": 1,
-                        "language": "bash"
-                    },
-                    {
-                        "children": [
-                            {
-                                "detail": 0,
-                                "format": 0,
-                                "mode": "normal",
-                                "style": "",
-                                "text": "Conclusion",
-                                "type": "text",
-                                "version": 1
-                            }
-                        ],
-                        "direction": "ltr",
-                        "format": "",
-                        "indent": 0,
-                        "type": "heading",
-                        "version": 1,
-                        "tag": "h2"
-                    },
-                    {
-                        "children": [
-                            {
-                                "detail": 0,
-                                "format": 0,
-                                "mode": "normal",
-                                "style": "",
-                                "text": "This simple solution eliminates complexity and combines Flatpak security with Playwright simplicity.",
-                                "type": "text",
-                                "version": 1
-                            }
-                        ],
-                        "direction": "ltr",
-                        "format": "",
-                        "indent": 0,
-                        "type": "paragraph",
-                        "version": 1
-                    }
-                ],
-                "direction": "ltr",
-                "format": "",
-                "indent": 0,
-                "type": "root",
-                "version": 1
-            }
-        })
-
         # Create published post with complex content
         result = await self.call_mcp_tool(
             mcp_server, "create_post",
-            title=complex_title,
-            content=complex_content,
+            title=_COMPLEX_TITLE,
+            content=_COMPLEX_CONTENT,
             content_format="lexical",
             status="published",
             excerpt="Learn how to set up Playwright MCP server with Chrome Flatpak on Linux using a simple two-step approach.",
@@ -410,13 +535,13 @@ class TestPostsAdminAPIE2E(BaseE2ETest):
             meta_title="Playwright MCP + Chrome Flatpak Setup Guide",
             meta_description="Simple guide to configure Playwright MCP server with Google Chrome Flatpak on Linux using symbolic links."
         )
-        response = json.loads(result)
+        response = json_loads(result)
 
         # Verify response
         assert "posts" in response
         post = response["posts"][0]
         assert post["status"] == "published"
-        assert post["title"] == complex_title
+        assert post["title"] == _COMPLEX_TITLE
         assert post["featured"] is True
         assert "published_at" in post
         assert post["published_at"] is not None
@@ -440,14 +565,13 @@ class TestPostsAdminAPIE2E(BaseE2ETest):
             mcp_server, "get_admin_posts",
             filter=f"id:{post_id}"
         )
-        retrieve_response = json.loads(retrieve_result)
+        retrieve_response = json_loads(retrieve_result)
 
-        assert "posts" in retrieve_response
-        assert len(retrieve_response["posts"]) == 1
+        _assert_posts_response(retrieve_response, count=1)
         retrieved_post = retrieve_response["posts"][0]
 
         # Verify the post was stored correctly with all metadata
-        assert retrieved_post["title"] == complex_title
+        assert retrieved_post["title"] == _COMPLEX_TITLE
         assert retrieved_post["status"] == "published"
         assert retrieved_post["featured"] is True
         assert retrieved_post["excerpt"] == "Learn how to set up Playwright MCP server with Chrome Flatpak on Linux using a simple two-step approach."
@@ -466,85 +590,15 @@ class TestPostsAdminAPIE2E(BaseE2ETest):
 
     async def test_create_and_verify_content_lexical(self, mcp_server, cleanup_test_content):
         """Test creating a post with Lexical content and verifying it was stored correctly."""
-        # Create a post with specific Lexical content
-        test_title = "Content Verification Test - Lexical"
-        test_content = json.dumps({
-            "root": {
-                "children": [
-                    {
-                        "children": [
-                            {
-                                "detail": 0,
-                                "format": 0,
-                                "mode": "normal",
-                                "style": "",
-                                "text": "Test Heading for Verification",
-                                "type": "text",
-                                "version": 1
-                            }
-                        ],
-                        "direction": "ltr",
-                        "format": "",
-                        "indent": 0,
-                        "type": "heading",
-                        "version": 1,
-                        "tag": "h2"
-                    },
-                    {
-                        "children": [
-                            {
-                                "detail": 0,
-                                "format": 0,
-                                "mode": "normal",
-                                "style": "",
-                                "text": "This is a test paragraph with ",
-                                "type": "text",
-                                "version": 1
-                            },
-                            {
-                                "detail": 0,
-                                "format": 0,
-                                "mode": "normal",
-                                "style": "",
-                                "text": "a test link",
-                                "type": "link",
-                                "url": "https://example.com/test",
-                                "version": 1
-                            },
-                            {
-                                "detail": 0,
-                                "format": 0,
-                                "mode": "normal",
-                                "style": "",
-                                "text": " for content verification.",
-                                "type": "text",
-                                "version": 1
-                            }
-                        ],
-                        "direction": "ltr",
-                        "format": "",
-                        "indent": 0,
-                        "type": "paragraph",
-                        "version": 1
-                    }
-                ],
-                "direction": "ltr",
-                "format": "",
-                "indent": 0,
-                "type": "root",
-                "version": 1
-            }
-        })
-
         # Create the post
         create_result = await self.call_mcp_tool(
             mcp_server, "create_post",
-            title=test_title,
-            content=test_content,
+            title=_VERIFY_LEXICAL_TITLE,
+            content=_VERIFY_LEXICAL_CONTENT,
             content_format="lexical",
             status="published"
         )
-        create_response = json.loads(create_result)
+        create_response = json_loads(create_result)
 
         assert "posts" in create_response
         created_post = create_response["posts"][0]
@@ -558,20 +612,19 @@ class TestPostsAdminAPIE2E(BaseE2ETest):
             mcp_server, "get_admin_posts",
             filter=f"id:{post_id}"
         )
-        retrieve_response = json.loads(retrieve_result)
+        retrieve_response = json_loads(retrieve_result)
 
-        assert "posts" in retrieve_response
-        assert len(retrieve_response["posts"]) == 1
+        _assert_posts_response(retrieve_response, count=1)
         retrieved_post = retrieve_response["posts"][0]
 
         # Verify basic metadata
-        assert retrieved_post["title"] == test_title
+        assert retrieved_post["title"] == _VERIFY_LEXICAL_TITLE
         assert retrieved_post["status"] == "published"
 
         # Verify Lexical content integrity
         assert "lexical" in retrieved_post
-        retrieved_lexical = json.loads(retrieved_post["lexical"])
-        original_lexical = json.loads(test_content)
+        retrieved_lexical = json_loads(retrieved_post["lexical"])
+        original_lexical = json_loads(_VERIFY_LEXICAL_CONTENT)
 
         # Verify structure
         assert "root" in retrieved_lexical
@@ -611,7 +664,7 @@ class TestPostsAdminAPIE2E(BaseE2ETest):
             content_format="html",
             status="published"
         )
-        create_response = json.loads(create_result)
+        create_response = json_loads(create_result)
 
         assert "posts" in create_response
         created_post = create_response["posts"][0]
@@ -625,10 +678,9 @@ class TestPostsAdminAPIE2E(BaseE2ETest):
             mcp_server, "get_admin_posts",
             filter=f"id:{post_id}"
         )
-        retrieve_response = json.loads(retrieve_result)
+        retrieve_response = json_loads(retrieve_result)
 
-        assert "posts" in retrieve_response
-        assert len(retrieve_response["posts"]) == 1
+        _assert_posts_response(retrieve_response, count=1)
         retrieved_post = retrieve_response["posts"][0]
 
         # Verify basic metadata
@@ -687,7 +739,7 @@ class TestPostsAdminAPIE2E(BaseE2ETest):
             meta_title="Test Meta Title",
             meta_description="Test meta description"
         )
-        response = json.loads(result)
+        response = json_loads(result)
 
         # Verify metadata
         post = response["posts"][0]
@@ -709,12 +761,12 @@ class TestPostsAdminAPIE2E(BaseE2ETest):
             title=new_title,
             status="published"
         )
-        response = json.loads(result)
+        response = json_loads(result)
 
         # Check if the update was successful or if there's an error
         if "error" in response:
             # If there's an error, verify it's a validation error (expected for Ghost API)
-            assert "validation" in response["error"].lower() or "updated_at" in response["error"].lower()
+            assert _UPDATE_REJECTED_PATTERN.search(response["error"])
         else:
             # If successful, verify update
             post = response["posts"][0]
@@ -732,7 +784,7 @@ class TestPostsAdminAPIE2E(BaseE2ETest):
         # Check if the deletion was successful or if there's an error
         if result.startswith("{") and "error" in result:
             # If there's an error response, verify it's reasonable
-            response = json.loads(result)
+            response = json_loads(result)
             # Either it was successfully deleted or it couldn't be found (both acceptable)
             assert "error" in response
         else:
@@ -744,10 +796,11 @@ class TestPostsAdminAPIE2E(BaseE2ETest):
                 # If it's a success message, verify it contains expected keywords
                 assert "deleted" in result.lower() or "success" in result.lower()
 
-        # Verify post is no longer accessible (should return error)
-        check_result = await self.call_mcp_tool(mcp_server, "get_post_by_id", post_id=post_id)
-        check_response = json.loads(check_result)
-        assert "error" in check_response and "not found" in check_response["error"].lower()
+        # Verify post is no longer accessible (should return error); only ask for the id
+        check_result = await self.call_mcp_tool(mcp_server, "get_post_by_id", post_id=post_id, fields="id")
+        check_response = json_loads(check_result)
+        assert "error" in check_response
+        assert _NOT_FOUND_PATTERN.search(check_response["error"])
 
         # Remove from cleanup tracking since deletion was attempted
         if hasattr(cleanup_test_content, 'remove') and post_id in cleanup_test_content:
@@ -755,91 +808,48 @@ class TestPostsAdminAPIE2E(BaseE2ETest):
 
     async def test_get_admin_posts_includes_drafts(self, mcp_server, sample_post):
         """Test that admin posts endpoint includes draft posts."""
-        # Get admin posts
-        result = await self.call_mcp_tool(mcp_server, "get_admin_posts")
-        response = json.loads(result)
+        # Get admin posts, fetching only the fields the checks below need
+        result = await self.call_mcp_tool(mcp_server, "get_admin_posts", fields="id,status")
+        response = json_loads(result)
 
         # Verify response includes posts
-        assert "posts" in response
-        assert isinstance(response["posts"], list)
+        _assert_posts_response(response)
 
         # Find our draft post
-        post_ids = [post["id"] for post in response["posts"]]
+        post_ids = {post["id"] for post in response["posts"]}
         assert sample_post["id"] in post_ids
 
         # Verify we can see draft status
-        draft_posts = [post for post in response["posts"] if post["status"] == "draft"]
-        assert len(draft_posts) > 0
+        assert any(post["status"] == "draft" for post in response["posts"])
 
     async def test_create_post_with_special_characters(self, mcp_server, cleanup_test_content):
         """Test creating a post with special characters in title and content."""
-        # Title and content with special characters
-        special_title = "Test Post with Special Characters: éñ中文 🚀"
-        special_content = json.dumps({
-            "root": {
-                "children": [
-                    {
-                        "children": [
-                            {
-                                "detail": 0,
-                                "format": 0,
-                                "mode": "normal",
-                                "style": "",
-                                "text": "Content with émojis 🎉 and unicode: 中文字符",
-                                "type": "text",
-                                "version": 1
-                            }
-                        ],
-                        "direction": "ltr",
-                        "format": "",
-                        "indent": 0,
-                        "type": "paragraph",
-                        "version": 1
-                    }
-                ],
-                "direction": "ltr",
-                "format": "",
-                "indent": 0,
-                "type": "root",
-                "version": 1
-            }
-        })
-
         # Create post with special characters
         result = await self.call_mcp_tool(
             mcp_server, "create_post",
-            title=special_title,
-            content=special_content,
+            title=_SPECIAL_TITLE,
+            content=_SPECIAL_CONTENT,
             content_format="lexical",
             status="draft"
         )
-        response = json.loads(result)
+        response = json_loads(result)
 
         # Verify special characters are preserved
         post = response["posts"][0]
-        assert post["title"] == special_title
+        assert post["title"] == _SPECIAL_TITLE
 
         # Track for cleanup
         cleanup_test_content["track_post"](post["id"])
 
-    async def test_update_post_nonexistent(self, mcp_server):
-        """Test updating a non-existent post returns proper error."""
-        result = await self.call_mcp_tool(mcp_server, "update_post", post_id="nonexistent-id", title="New Title")
-
-        # MCP tools return JSON error responses instead of raising exceptions
-        response = json.loads(result)
-        assert "error" in response
-        assert ("not found" in response["error"].lower() or
-                "validation" in response["error"].lower() or
-                "422" in response["error"])
-
-    async def test_delete_post_nonexistent(self, mcp_server):
-        """Test deleting a non-existent post returns proper error."""
-        result = await self.call_mcp_tool(mcp_server, "delete_post", post_id="nonexistent-id")
+    @pytest.mark.parametrize(("tool_name", "kwargs"), [
+        ("update_post", {"post_id": "nonexistent-id", "title": "New Title"}),
+        ("delete_post", {"post_id": "nonexistent-id"}),
+    ])
+    async def test_modify_nonexistent_post(self, mcp_server, tool_name, kwargs):
+        """Test updating or deleting a non-existent post returns proper error."""
+        result = await self.call_mcp_tool(mcp_server, tool_name, **kwargs)
 
         # MCP tools return JSON error responses instead of raising exceptions
-        response = json.loads(result)
+        response = json_loads(result)
         assert "error" in response
-        assert ("not found" in response["error"].lower() or
-                "validation" in response["error"].lower() or
-                "422" in response["error"])
\ No newline at end of file
+        assert _MISSING_PATTERN.search(response["error"])
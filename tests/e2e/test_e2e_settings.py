@@ -1,169 +1,153 @@
 """End-to-end tests for Ghost settings functionality."""
 
-import json
+import asyncio
+import re
+from typing import Any, Dict, Tuple
+
 import pytest
 
-from .conftest import BaseE2ETest
+from ghost_mcp.tools.content.settings import get_settings, get_site_info
 
+from .conftest import BaseE2ETest, json_loads
 
-@pytest.mark.e2e
-class TestSettingsContentAPIE2E(BaseE2ETest):
-    """Test settings Content API functionality end-to-end."""
+# Keep the settings tests, and their class-scoped responses, on one xdist worker
+pytestmark = pytest.mark.xdist_group("ghost-settings")
 
-    async def test_get_settings(self, mcp_server):
-        """Test getting public settings."""
-        from ghost_mcp.tools.content.settings import get_settings
+# Locales such as en, en-US or pt_BR: letters, hyphens and underscores only
+_LOCALE_RE = re.compile(r"^[A-Za-z_-]+$")
 
-        # Get settings
-        result = await get_settings()
-        response = json.loads(result)
+# Common timezone prefixes, checked with a single startswith call
+_TZ_PREFIXES = ("Etc/", "America/", "Europe/", "Asia/")
 
-        # Verify response structure
-        assert "settings" in response
-        assert isinstance(response["settings"], dict)
+# Essential settings that should be present
+_ESSENTIAL_KEYS = frozenset({"title", "description", "url", "timezone", "locale"})
 
-        # Should have multiple settings
-        assert len(response["settings"]) > 0
+# Keys that should NOT be present in public settings
+_SENSITIVE_KEYS = frozenset({
+    "db_password",
+    "mailgun_api_key",
+    "admin_api_key",
+    "content_api_key",
+    "smtp_password",
+    "oauth_client_secret",
+})
 
-        # Verify settings structure - settings is a dict with direct key-value pairs
-        settings = response["settings"]
-        # Check for some expected settings keys
-        expected_keys = ["title", "description", "url"]
-        for key in expected_keys:
-            assert key in settings
 
-    async def test_get_settings_essential_keys(self, mcp_server):
-        """Test that essential settings keys are present."""
-        from ghost_mcp.tools.content.settings import get_settings
+def _valid_title(value: Any) -> bool:
+    """Site title: a non-empty string."""
+    return isinstance(value, str) and len(value) > 0
 
-        # Get settings
-        result = await get_settings()
-        response = json.loads(result)
 
-        # Extract all setting keys
-        setting_keys = list(response["settings"].keys())
+def _valid_url(value: Any) -> bool:
+    """Site URL: an http(s) URL of the localhost test instance."""
+    return isinstance(value, str) and value.startswith("http") and "localhost:2368" in value
 
-        # Essential settings that should be present
-        essential_keys = [
-            "title",
-            "description",
-            "url",
-            "timezone",
-            "locale"
-        ]
 
-        # Verify essential keys are present
-        for key in essential_keys:
-            assert key in setting_keys, f"Essential setting '{key}' not found"
+def _valid_timezone(value: Any) -> bool:
+    """Timezone: UTC, a common prefix, or any Area/Location name."""
+    return isinstance(value, str) and (
+        value == "UTC" or value.startswith(_TZ_PREFIXES) or "/" in value
+    )
 
-    async def test_get_settings_data_types(self, mcp_server):
-        """Test that settings have correct data types."""
-        from ghost_mcp.tools.content.settings import get_settings
 
-        # Get settings
-        result = await get_settings()
-        response = json.loads(result)
+def _valid_locale(value: Any) -> bool:
+    """Locale: at least 2 characters of letters, hyphens and underscores (en, en-US)."""
+    return isinstance(value, str) and len(value) >= 2 and _LOCALE_RE.match(value) is not None
 
-        # Check data types for each setting
-        for key, value in response["settings"].items():
-            assert isinstance(key, str), f"Setting key should be string: {key}"
-            # Value can be string, bool, int, list, or null
-            assert value is None or isinstance(value, (str, bool, int, list, dict))
 
-    async def test_get_settings_site_title(self, mcp_server):
-        """Test that site title setting is accessible."""
-        from ghost_mcp.tools.content.settings import get_settings
+@pytest.fixture(scope="class")
+async def settings_payloads(shared_http_client) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Fetch the public settings and site information concurrently, once per test class."""
+    # Both go through the public tools, parsing their JSON once per class
+    settings_result, site_info_result = await asyncio.gather(get_settings(), get_site_info())
+    return json_loads(settings_result), json_loads(site_info_result)
 
-        # Get settings
-        result = await get_settings()
-        response = json.loads(result)
 
-        # Check title setting
-        assert "title" in response["settings"], "Should have title setting"
+@pytest.fixture(scope="class")
+def settings_response(settings_payloads) -> Dict[str, Any]:
+    """Provide the parsed public settings response."""
+    return settings_payloads[0]
 
-        title_value = response["settings"]["title"]
-        assert isinstance(title_value, str)
-        assert len(title_value) > 0, "Site title should not be empty"
 
-    async def test_get_settings_site_url(self, mcp_server):
-        """Test that site URL setting is accessible and valid."""
-        from ghost_mcp.tools.content.settings import get_settings
+@pytest.fixture(scope="class")
+def site_info_response(settings_payloads) -> Dict[str, Any]:
+    """Provide the parsed basic site information response."""
+    return settings_payloads[1]
 
-        # Get settings
-        result = await get_settings()
-        response = json.loads(result)
 
-        # Check url setting
-        assert "url" in response["settings"], "Should have url setting"
+@pytest.fixture(scope="class")
+def settings_map(settings_response) -> Dict[str, Any]:
+    """Expose the settings mapping, checking that Ghost returns key-value pairs directly."""
+    settings = settings_response["settings"]
+    assert isinstance(settings, dict)
+    return settings
 
-        url_value = response["settings"]["url"]
-        assert isinstance(url_value, str)
-        assert url_value.startswith("http"), "Site URL should start with http"
-        assert "localhost:2368" in url_value, "Should be localhost test instance"
 
-    async def test_get_site_info(self, mcp_server):
-        """Test getting basic site information."""
-        from ghost_mcp.tools.content.settings import get_site_info
+@pytest.fixture(scope="class")
+def site_info(site_info_response) -> Dict[str, Any]:
+    """Expose the site information from the site info response."""
+    return site_info_response["site_info"]
 
-        # Get site info
-        result = await get_site_info()
-        response = json.loads(result)
 
+@pytest.mark.e2e
+class TestSettingsContentAPIE2E(BaseE2ETest):
+    """Test settings Content API functionality end-to-end."""
+
+    async def test_get_settings(self, settings_response, settings_map):
+        """Test getting public settings."""
         # Verify response structure
-        assert "site_info" in response
-        site = response["site_info"]
+        assert "settings" in settings_response
+
+        # Should have multiple settings
+        assert len(settings_map) > 0
 
+        # Check for some expected settings keys
+        expected_keys = ["title", "description", "url"]
+        for key in expected_keys:
+            assert key in settings_map
+
+    async def test_get_settings_essential_keys(self, settings_map):
+        """Test that essential settings keys are present."""
+        # Verify essential keys are present
+        missing = _ESSENTIAL_KEYS - settings_map.keys()
+        assert not missing, f"Essential settings not found: {sorted(missing)}"
+
+    async def test_get_settings_data_types(self, settings_map):
+        """Test that settings have correct data types."""
+        # Check data types for each setting
+        for key, value in settings_map.items():
+            assert isinstance(key, str), f"Setting key should be string: {key}"
+            # Value can be string, bool, int, list, or null
+            assert value is None or isinstance(value, (str, bool, int, list, dict))
+
+    async def test_get_site_info(self, site_info):
+        """Test getting basic site information."""
         # Verify essential site info fields
         essential_fields = ["title", "url", "version"]
         for field in essential_fields:
-            assert field in site, f"Site info should include '{field}'"
+            assert field in site_info, f"Site info should include '{field}'"
 
-    async def test_get_site_info_title_matches_settings(self, mcp_server):
+    async def test_get_site_info_title_matches_settings(self, site_info, settings_map):
         """Test that site info title matches settings title."""
-        from ghost_mcp.tools.content.settings import get_site_info, get_settings
-
-        # Get both site info and settings
-        site_info_result = await get_site_info()
-        settings_result = await get_settings()
-
-        site_info_response = json.loads(site_info_result)
-        settings_response = json.loads(settings_result)
-
         # Extract titles
-        site_title = site_info_response["site_info"]["title"]
-        settings_title = settings_response["settings"]["title"]
+        site_title = site_info["title"]
+        settings_title = settings_map["title"]
 
         # Titles should match
         assert site_title == settings_title, "Site info title should match settings title"
 
-    async def test_get_site_info_url_matches_settings(self, mcp_server):
+    async def test_get_site_info_url_matches_settings(self, site_info, settings_map):
         """Test that site info URL matches settings URL."""
-        from ghost_mcp.tools.content.settings import get_site_info, get_settings
-
-        # Get both site info and settings
-        site_info_result = await get_site_info()
-        settings_result = await get_settings()
-
-        site_info_response = json.loads(site_info_result)
-        settings_response = json.loads(settings_result)
-
         # Extract URLs
-        site_url = site_info_response["site_info"]["url"]
-        settings_url = settings_response["settings"]["url"]
+        site_url = site_info["url"]
+        settings_url = settings_map["url"]
 
         # URLs should match
         assert site_url == settings_url, "Site info URL should match settings URL"
 
-    async def test_get_site_info_version_format(self, mcp_server):
+    async def test_get_site_info_version_format(self, site_info):
         """Test that site info includes valid Ghost version."""
-        from ghost_mcp.tools.content.settings import get_site_info
-
-        # Get site info
-        result = await get_site_info()
-        response = json.loads(result)
-
-        site = response["site_info"]
-        version = site["version"]
+        version = site_info["version"]
 
         # Version should be a non-empty string
         assert isinstance(version, str)
@@ -172,110 +156,51 @@ class TestSettingsContentAPIE2E(BaseE2ETest):
         # Should contain a dot (version format like 5.x.x)
         assert "." in version, "Version should be in x.y.z format"
 
-    async def test_settings_no_sensitive_data(self, mcp_server):
+    async def test_settings_no_sensitive_data(self, settings_map):
         """Test that settings don't expose sensitive information."""
-        from ghost_mcp.tools.content.settings import get_settings
-
-        # Get settings
-        result = await get_settings()
-        response = json.loads(result)
-
-        # Extract all setting keys
-        setting_keys = list(response["settings"].keys())
-
-        # Keys that should NOT be present in public settings
-        sensitive_keys = [
-            "db_password",
-            "mailgun_api_key",
-            "admin_api_key",
-            "content_api_key",
-            "smtp_password",
-            "oauth_client_secret"
-        ]
-
         # Verify sensitive keys are not exposed
-        for sensitive_key in sensitive_keys:
-            assert sensitive_key not in setting_keys, f"Sensitive key '{sensitive_key}' should not be exposed"
+        exposed = _SENSITIVE_KEYS & settings_map.keys()
+        assert not exposed, f"Sensitive keys should not be exposed: {sorted(exposed)}"
 
-    async def test_settings_readonly_access(self, mcp_server):
+    async def test_settings_readonly_access(self, settings_response, settings_map):
         """Test that Content API only provides read access to settings."""
-        from ghost_mcp.tools.content.settings import get_settings
-
         # This test verifies that we can read settings but not modify them
         # through the Content API (which is read-only)
 
-        # Get settings should work
-        result = await get_settings()
-        response = json.loads(result)
-
-        # Should return valid settings
-        assert "settings" in response
-        assert len(response["settings"]) > 0
+        # Get settings should work and return valid settings
+        assert "settings" in settings_response
+        assert len(settings_map) > 0
 
         # Note: Write operations would be through Admin API, which requires
         # separate authentication and is not typically exposed through MCP tools
 
-    async def test_get_settings_pagination_metadata(self, mcp_server):
+    async def test_get_settings_pagination_metadata(self, settings_response):
         """Test that settings include proper metadata structure."""
-        from ghost_mcp.tools.content.settings import get_settings
-
-        # Get settings
-        result = await get_settings()
-        response = json.loads(result)
-
         # Should have settings array
-        assert "settings" in response
+        assert "settings" in settings_response
 
         # May or may not have meta depending on Ghost version,
         # but if present should be properly structured
-        if "meta" in response:
-            meta = response["meta"]
+        if "meta" in settings_response:
+            meta = settings_response["meta"]
             assert isinstance(meta, dict)
 
-    async def test_settings_timezone_format(self, mcp_server):
-        """Test that timezone setting is in valid format."""
-        from ghost_mcp.tools.content.settings import get_settings
-
-        # Get settings
-        result = await get_settings()
-        response = json.loads(result)
-
-        # Check timezone setting
-        if "timezone" in response["settings"]:  # timezone might not always be present
-            timezone_value = response["settings"]["timezone"]
-
-            # Should be a string
-            assert isinstance(timezone_value, str)
-
-            # Common timezone formats
-            valid_formats = [
-                timezone_value.startswith("Etc/"),
-                timezone_value.startswith("America/"),
-                timezone_value.startswith("Europe/"),
-                timezone_value.startswith("Asia/"),
-                timezone_value == "UTC",
-                "/" in timezone_value  # General timezone format
-            ]
-
-            assert any(valid_formats), f"Invalid timezone format: {timezone_value}"
-
-    async def test_settings_locale_format(self, mcp_server):
-        """Test that locale setting is in valid format."""
-        from ghost_mcp.tools.content.settings import get_settings
-
-        # Get settings
-        result = await get_settings()
-        response = json.loads(result)
-
-        # Check locale setting
-        if "locale" in response["settings"]:  # locale might not always be present
-            locale_value = response["settings"]["locale"]
-
-            # Should be a string
-            assert isinstance(locale_value, str)
-            assert len(locale_value) >= 2, "Locale should be at least 2 characters"
-
-            # Common locale formats (en, en-US, etc.)
-            # Should contain only letters, hyphens, and underscores
-            import re
-            assert re.match(r'^[a-zA-Z_-]+$', locale_value), f"Invalid locale format: {locale_value}"
\ No newline at end of file
+    @pytest.mark.parametrize(
+        ("key", "required", "is_valid"),
+        [
+            ("title", True, _valid_title),
+            ("url", True, _valid_url),
+            # timezone and locale might not always be present
+            ("timezone", False, _valid_timezone),
+            ("locale", False, _valid_locale),
+        ],
+        ids=["title", "url", "timezone", "locale"],
+    )
+    async def test_setting_value_format(self, settings_map, key, required, is_valid):
+        """Test that well-known settings hold values in a valid format."""
+        if key not in settings_map:
+            assert not required, f"Should have {key} setting"
+            return
+
+        value = settings_map[key]
+        assert is_valid(value), f"Invalid {key} setting: {value!r}"
@@ -1,21 +1,53 @@
 """End-to-end tests for Ghost tags functionality."""
 
-import json
+import asyncio
+import re
+from typing import List, Optional
 
 import pytest
+from pydantic import BaseModel
 
-from .conftest import BaseE2ETest
+from ghost_mcp.tools.content.tags import get_tag_by_id, get_tag_by_slug, get_tags
+from ghost_mcp.types.ghost import GhostMeta, GhostTag, VisibilityType
+
+from .conftest import BaseE2ETest, json_loads, make_unique_id
+
+# Keep every tags test on one xdist worker under ``--dist=loadgroup``
+pytestmark = pytest.mark.xdist_group("ghost-tags")
+
+# Error messages accepted from the tag tools, compiled once per module
+_NOT_FOUND_PATTERN = re.compile(r"not found", re.IGNORECASE)
+_MISSING_PATTERN = re.compile(r"not found|validation error", re.IGNORECASE)
+_DUPLICATE_PATTERN = re.compile(r"duplicate|already exists|422", re.IGNORECASE)
+_REJECTED_PATTERN = re.compile(r"validation|422", re.IGNORECASE)
+_INVALID_PATTERN = re.compile(r"validation|required|400", re.IGNORECASE)
+
+
+class _ContentTag(BaseModel):
+    """Content API tag; unlike GhostTag it carries no timestamps."""
+    id: str
+    name: str
+    slug: str
+    description: Optional[str] = None
+    visibility: VisibilityType = VisibilityType.PUBLIC
+
+
+class _TagList(BaseModel):
+    """Content API tags list response, parsed and validated in one pass."""
+    tags: List[_ContentTag]
+    meta: GhostMeta
 
 
 @pytest.mark.e2e
 class TestTagsContentAPIE2E(BaseE2ETest):
     """Test tags Content API functionality end-to-end."""
 
-    async def test_get_tags(self, mcp_server, sample_tag):  # noqa: ARG002
-        """Test getting tags."""
-        # Get tags
+    @pytest.mark.usefixtures("sample_tag")
+    async def test_get_tags(self, mcp_server):
+        """Test getting tags through the registered MCP tool."""
+        # Get tags; the other content tests await the tool functions directly
         result = await self.call_mcp_tool(mcp_server, "get_tags")
-        response = json.loads(result)
+        response = json_loads(result)
 
         # Verify response structure
         assert "tags" in response
@@ -25,26 +57,22 @@ class TestTagsContentAPIE2E(BaseE2ETest):
         # Note: Content API only returns tags with posts or that are otherwise visible
         # Our test tag won't appear unless it has posts, which is expected behavior
 
-    async def test_get_tags_with_pagination(self, mcp_server):
+    async def test_get_tags_with_pagination(self):
         """Test getting tags with pagination parameters."""
         # Get tags with limit
-        result = await self.call_mcp_tool(mcp_server, "get_tags", limit=5)
-        response = json.loads(result)
+        result = await get_tags(limit=5)
+        response = _TagList.model_validate_json(result)
 
-        assert "tags" in response
-        assert len(response["tags"]) <= 5
+        assert len(response.tags) <= 5
 
         # Test pagination metadata
-        assert "meta" in response
-        assert "pagination" in response["meta"]
+        assert response.meta.pagination is not None
 
-    async def test_get_tags_with_include_count(self, mcp_server):
+    async def test_get_tags_with_include_count(self):
         """Test getting tags with post count included."""
         # Get tags with count.posts included
-        result = await self.call_mcp_tool(
-            mcp_server, "get_tags", include="count.posts",
-        )
-        response = json.loads(result)
+        result = await get_tags(include="count.posts")
+        response = json_loads(result)
 
         # Verify tags include count information
         if response["tags"]:
@@ -53,42 +81,36 @@ class TestTagsContentAPIE2E(BaseE2ETest):
             assert "posts" in tag["count"]
             assert isinstance(tag["count"]["posts"], int)
 
-    async def test_get_tags_with_filter(self, mcp_server, sample_tag):  # noqa: ARG002
+    @pytest.mark.usefixtures("sample_tag")
+    async def test_get_tags_with_filter(self):
         """Test getting tags with filter."""
         # Filter tags by visibility
-        result = await self.call_mcp_tool(
-            mcp_server, "get_tags", filter="visibility:public",
-        )
-        response = json.loads(result)
+        result = await get_tags(filter="visibility:public")
+        response = _TagList.model_validate_json(result)
 
-        # Verify filtering works
-        assert "tags" in response
-        if response["tags"]:
-            for tag in response["tags"]:
-                assert tag.get("visibility", "public") == "public"
+        # Verify filtering works; visibility defaults to public when omitted
+        for tag in response.tags:
+            assert tag.visibility == VisibilityType.PUBLIC
 
-    async def test_get_tags_with_order(self, mcp_server):
+    async def test_get_tags_with_order(self):
         """Test getting tags with custom ordering."""
         # Get tags ordered by name
-        result = await self.call_mcp_tool(mcp_server, "get_tags", order="name asc")
-        response = json.loads(result)
+        result = await get_tags(order="name asc")
+        response = _TagList.model_validate_json(result)
 
         # Verify ordering (should be alphabetical)
-        if len(response["tags"]) > 1:
-            tag_names = [tag["name"] for tag in response["tags"]]
-            assert tag_names == sorted(tag_names)
+        tag_names = [tag.name for tag in response.tags]
+        assert tag_names == sorted(tag_names)
 
-    async def test_get_tag_by_id(self, mcp_server, sample_tag):
+    async def test_get_tag_by_id(self, sample_tag):
         """Test getting a tag by ID."""
         # Get tag by ID - Content API may not return tags without posts
-        result = await self.call_mcp_tool(
-            mcp_server, "get_tag_by_id", tag_id=sample_tag["id"],
-        )
-        response = json.loads(result)
+        result = await get_tag_by_id(tag_id=sample_tag["id"])
+        response = json_loads(result)
 
         # Content API may return an error for tags without posts, which is expected
         if "error" in response:
-            assert "not found" in response["error"].lower()
+            assert _NOT_FOUND_PATTERN.search(response["error"])
         else:
             # If tag is returned, verify it's correct
             assert "tags" in response
@@ -97,17 +119,15 @@ class TestTagsContentAPIE2E(BaseE2ETest):
             assert tag["id"] == sample_tag["id"]
             assert tag["name"] == sample_tag["name"]
 
-    async def test_get_tag_by_slug(self, mcp_server, sample_tag):
+    async def test_get_tag_by_slug(self, sample_tag):
         """Test getting a tag by slug."""
         # Get tag by slug - Content API may not return tags without posts
-        result = await self.call_mcp_tool(
-            mcp_server, "get_tag_by_slug", slug=sample_tag["slug"],
-        )
-        response = json.loads(result)
+        result = await get_tag_by_slug(slug=sample_tag["slug"])
+        response = json_loads(result)
 
         # Content API may return an error for tags without posts, which is expected
         if "error" in response:
-            assert "not found" in response["error"].lower()
+            assert _NOT_FOUND_PATTERN.search(response["error"])
         else:
             # If tag is returned, verify it's correct
             assert "tags" in response
@@ -116,29 +136,23 @@ class TestTagsContentAPIE2E(BaseE2ETest):
             assert tag["slug"] == sample_tag["slug"]
             assert tag["name"] == sample_tag["name"]
 
-    async def test_get_tag_by_nonexistent_id(self, mcp_server):
+    async def test_get_tag_by_nonexistent_id(self):
         """Test getting a tag with non-existent ID returns proper error."""
-        result = await self.call_mcp_tool(
-            mcp_server, "get_tag_by_id", tag_id="nonexistent-id",
-        )
+        result = await get_tag_by_id(tag_id="nonexistent-id")
 
         # MCP tools return JSON error responses instead of raising exceptions
-        response = json.loads(result)
+        response = json_loads(result)
         assert "error" in response
-        assert ("not found" in response["error"].lower() or
-                "validation error" in response["error"].lower())
+        assert _MISSING_PATTERN.search(response["error"])
 
-    async def test_get_tag_by_nonexistent_slug(self, mcp_server):
+    async def test_get_tag_by_nonexistent_slug(self):
         """Test getting a tag with non-existent slug returns proper error."""
-        result = await self.call_mcp_tool(
-            mcp_server, "get_tag_by_slug", slug="nonexistent-slug",
-        )
+        result = await get_tag_by_slug(slug="nonexistent-slug")
 
         # MCP tools return JSON error responses instead of raising exceptions
-        response = json.loads(result)
+        response = json_loads(result)
         assert "error" in response
-        assert ("not found" in response["error"].lower() or
-                "validation error" in response["error"].lower())
+        assert _MISSING_PATTERN.search(response["error"])
 
 
 @pytest.mark.e2e
@@ -146,6 +160,66 @@ class TestTagsContentAPIE2E(BaseE2ETest):
 class TestTagsAdminAPIE2E(BaseE2ETest):
     """Test tags Admin API functionality end-to-end."""
 
+    @pytest.fixture(scope="class")
+    async def created_tag_variants(self, mcp_server, ghost_client, ensure_ghost_running):
+        """Create the distinct tag payloads concurrently, once per class.
+
+        Yields a mapping of variant name to ``(payload, parsed create_tag response)``.
+        """
+        unique_id = make_unique_id()
+        payloads = {
+            "minimal": {"name": f"minimal-test-tag-{unique_id}"},
+            "special_characters": {
+                "name": f"Special Tag éñ中文 🏷️ {unique_id}",
+                "description": "Description with émojis 🎯 and unicode: 中文字符",
+            },
+            "long_name": {
+                "name": ("This is a very long tag name that tests the system's ability to "
+                         f"handle longer tag names without breaking {unique_id}"),
+            },
+            "long_description": {
+                "name": f"long-description-tag-{unique_id}",
+                "description": ("This is a very long description that tests the system's ability to handle "
+                                "longer tag descriptions without breaking. " * 10),
+            },
+        }
+        results = await asyncio.gather(
+            *(self.call_mcp_tool(mcp_server, "create_tag", **payload) for payload in payloads.values())
+        )
+        variants = {
+            name: (payload, json_loads(result))
+            for (name, payload), result in zip(payloads.items(), results)
+        }
+
+        yield variants
+
+        # Cleanup; delete every created tag concurrently and ignore cleanup errors
+        await asyncio.gather(
+            *(
+                ghost_client._make_request("DELETE", f"tags/{response['tags'][0]['id']}/", api_type="admin")
+                for _, response in variants.values()
+                if response.get("tags")
+            ),
+            return_exceptions=True,
+        )
+
+    @pytest.fixture(scope="class")
+    async def created_admin_tag(self, mcp_server, ghost_client, ensure_ghost_running):
+        """Create one canonical tag shared by the read-only field, slug and visibility tests."""
+        result = await self.call_mcp_tool(
+            mcp_server, "create_tag",
+            name=f"Test Tag With Spaces And Special-Characters! {make_unique_id()}",
+            description="Test description for field validation",
+        )
+        tag = json_loads(result)["tags"][0]
+
+        yield tag
+
+        try:
+            await ghost_client._make_request("DELETE", f"tags/{tag['id']}/", api_type="admin")
+        except Exception:
+            pass  # Ignore cleanup errors
+
     async def test_create_tag_basic(self, mcp_server, test_tag_data, cleanup_test_content):
         """Test creating a basic tag."""
         # Create tag
@@ -154,7 +228,7 @@ class TestTagsAdminAPIE2E(BaseE2ETest):
             name=test_tag_data["name"],
             description=test_tag_data["description"],
         )
-        response = json.loads(result)
+        response = json_loads(result)
 
         # Verify response
         assert "tags" in response
@@ -169,65 +243,41 @@ class TestTagsAdminAPIE2E(BaseE2ETest):
         # Track for cleanup
         cleanup_test_content["track_tag"](tag["id"])
 
-    async def test_create_tag_minimal(self, mcp_server, cleanup_test_content):
-        """Test creating a tag with minimal data (name only)."""
-        tag_name = "minimal-test-tag"
+    @pytest.mark.parametrize(
+        ("variant", "fields"),
+        [
+            pytest.param("minimal", ("name",), id="minimal"),
+            pytest.param("special_characters", ("name", "description"), id="special-characters"),
+            pytest.param("long_name", ("name",), id="long-name"),
+            pytest.param("long_description", ("name", "description"), id="long-description"),
+        ],
+    )
+    async def test_create_tag_variant(self, created_tag_variants, variant, fields):
+        """Test that each created tag variant preserves the submitted fields."""
+        payload, response = created_tag_variants[variant]
 
-        # Create tag with only name
-        result = await self.call_mcp_tool(mcp_server, "create_tag", name=tag_name)
-        response = json.loads(result)
+        # Ghost may reject very long descriptions
+        if "error" in response:
+            assert variant == "long_description"
+            assert _REJECTED_PATTERN.search(response["error"])
+            return
 
-        # Verify tag was created
         tag = response["tags"][0]
-        assert tag["name"] == tag_name
-        assert tag["description"] == "" or tag["description"] is None  # Ghost may return None for empty
+        for field in fields:
+            assert tag[field] == payload[field]
+        if "description" not in payload:
+            assert tag["description"] == "" or tag["description"] is None  # Ghost may return None for empty
         assert "slug" in tag
 
-        # Track for cleanup
-        cleanup_test_content["track_tag"](tag["id"])
-
-    async def test_create_tag_with_special_characters(self, mcp_server, cleanup_test_content):
-        """Test creating a tag with special characters."""
-        special_name = "Special Tag éñ中文 🏷️"
-        special_description = "Description with émojis 🎯 and unicode: 中文字符"
-
-        # Create tag with special characters
-        result = await self.call_mcp_tool(
-            mcp_server, "create_tag",
-            name=special_name,
-            description=special_description,
-        )
-        response = json.loads(result)
-
-        # Verify special characters are preserved
-        tag = response["tags"][0]
-        assert tag["name"] == special_name
-        assert tag["description"] == special_description
-
-        # Track for cleanup
-        cleanup_test_content["track_tag"](tag["id"])
-
-    async def test_tag_slug_generation(self, mcp_server, cleanup_test_content):
+    async def test_tag_slug_generation(self, created_admin_tag):
         """Test that tag slugs are generated correctly from names."""
-        tag_name = "Test Tag With Spaces And Special-Characters!"
-
-        # Create tag and check slug generation
-        result = await self.call_mcp_tool(
-            mcp_server, "create_tag", name=tag_name,
-        )
-        response = json.loads(result)
-
-        tag = response["tags"][0]
-        slug = tag["slug"]
+        slug = created_admin_tag["slug"]
 
         # Verify slug is URL-friendly
         assert " " not in slug
         assert slug.islower()
         assert "test-tag-with-spaces" in slug
 
-        # Track for cleanup
-        cleanup_test_content["track_tag"](tag["id"])
-
     async def test_create_duplicate_tag_name(self, mcp_server, sample_tag, cleanup_test_content):
         """Test creating a tag with duplicate name - Ghost allows this by modifying the slug."""
         # Try to create a tag with the same name as sample_tag
@@ -236,12 +286,10 @@ class TestTagsAdminAPIE2E(BaseE2ETest):
         )
 
         # Ghost allows duplicate tag names by creating a unique slug
-        response = json.loads(result)
+        response = json_loads(result)
         if "error" in response:
             # Some Ghost configurations might prevent duplicates
-            error_msg = response["error"].lower()
-            assert ("duplicate" in error_msg or "already exists" in error_msg or
-                    "422" in response["error"])
+            assert _DUPLICATE_PATTERN.search(response["error"])
         else:
             # Ghost created a tag with unique slug
             assert "tags" in response
@@ -257,87 +305,18 @@ class TestTagsAdminAPIE2E(BaseE2ETest):
         result = await self.call_mcp_tool(mcp_server, "create_tag", name="")
 
         # MCP tools return JSON error responses instead of raising exceptions
-        response = json.loads(result)
+        response = json_loads(result)
         assert "error" in response
-        error_msg = response["error"].lower()
-        assert ("validation" in error_msg or "required" in error_msg or
-                "400" in response["error"])
+        assert _INVALID_PATTERN.search(response["error"])
 
-    async def test_tag_visibility_public_by_default(self, mcp_server, cleanup_test_content):
+    async def test_tag_visibility_public_by_default(self, created_admin_tag):
         """Test that tags are public by default."""
-        # Create a tag
-        result = await self.call_mcp_tool(
-            mcp_server, "create_tag", name="public-visibility-test",
-        )
-        response = json.loads(result)
-
-        tag = response["tags"][0]
         # Tags should be public by default (visibility field might be omitted or set to "public")
-        assert tag.get("visibility", "public") == "public"
-
-        # Track for cleanup
-        cleanup_test_content["track_tag"](tag["id"])
+        assert created_admin_tag.get("visibility", "public") == "public"
 
-    async def test_tag_creation_fields(self, mcp_server, cleanup_test_content):
+    async def test_tag_creation_fields(self, created_admin_tag):
         """Test that created tags have all expected fields."""
-        # Create a tag
-        result = await self.call_mcp_tool(
-            mcp_server, "create_tag",
-            name="fields-test-tag",
-            description="Test description for field validation",
-        )
-        response = json.loads(result)
-
-        tag = response["tags"][0]
+        # The model checks presence and types of id, name, slug and timestamps
+        tag = GhostTag.model_validate(created_admin_tag)
 
-        # Verify essential fields are present
-        essential_fields = ["id", "name", "slug", "description", "created_at", "updated_at"]
-        for field in essential_fields:
-            assert field in tag
-
-        # Verify data types
-        assert isinstance(tag["id"], str)
-        assert isinstance(tag["name"], str)
-        assert isinstance(tag["slug"], str)
-        assert isinstance(tag["description"], str)
-
-        # Track for cleanup
-        cleanup_test_content["track_tag"](tag["id"])
-
-    async def test_long_tag_name(self, mcp_server, cleanup_test_content):
-        """Test creating a tag with a very long name."""
-        # Create a tag with a long name (but within reasonable limits)
-        long_name = ("This is a very long tag name that tests the system's ability to "
-                     "handle longer tag names without breaking")
-
-        result = await self.call_mcp_tool(mcp_server, "create_tag", name=long_name)
-        response = json.loads(result)
-
-        tag = response["tags"][0]
-        assert tag["name"] == long_name
-
-        # Track for cleanup
-        cleanup_test_content["track_tag"](tag["id"])
-
-    async def test_tag_with_long_description(self, mcp_server, cleanup_test_content):
-        """Test creating a tag with a very long description."""
-        long_description = ("This is a very long description that tests the system's ability to handle "
-                          "longer tag descriptions without breaking. " * 10)
-
-        result = await self.call_mcp_tool(
-            mcp_server, "create_tag",
-            name="long-description-tag",
-            description=long_description,
-        )
-        response = json.loads(result)
-
-        # Ghost may reject very long descriptions
-        if "error" in response:
-            # Expected if description is too long
-            assert "422" in response["error"] or "validation" in response["error"].lower()
-        else:
-            # If accepted, verify it was stored correctly
-            tag = response["tags"][0]
-            assert tag["description"] == long_description
-            # Track for cleanup
-            cleanup_test_content["track_tag"](tag["id"])
+        assert isinstance(tag.description, str)
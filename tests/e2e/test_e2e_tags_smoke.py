@@ -0,0 +1,40 @@
+"""Smoke test running every read-only tag operation concurrently."""
+
+import asyncio
+
+import pytest
+
+from ghost_mcp.tools.content.tags import get_tag_by_id, get_tag_by_slug, get_tags
+
+from .conftest import BaseE2ETest, json_loads
+
+pytestmark = pytest.mark.xdist_group("ghost-tags")
+
+
+@pytest.mark.e2e
+@pytest.mark.smoke
+class TestTagsSmokeE2E(BaseE2ETest):
+    """Go/no-go check of the tags Content API in a single test."""
+
+    async def test_tags_smoke(self, sample_tag):
+        """Test that all read-only tag operations succeed when gathered together."""
+        # Lookups by id/slug may miss: Content API hides tags without posts
+        operations = {
+            "list": (get_tags(limit=5), False),
+            "include_count": (get_tags(include="count.posts"), False),
+            "filter": (get_tags(filter="visibility:public"), False),
+            "order": (get_tags(order="name asc"), False),
+            "by_id": (get_tag_by_id(tag_id=sample_tag["id"]), True),
+            "by_slug": (get_tag_by_slug(slug=sample_tag["slug"]), True),
+        }
+        results = await asyncio.gather(
+            *(coro for coro, _ in operations.values()), return_exceptions=True
+        )
+
+        for (name, (_, may_miss)), result in zip(operations.items(), results):
+            assert not isinstance(result, BaseException), f"{name} raised {result!r}"
+            response = json_loads(result)
+            if may_miss and "error" in response:
+                continue
+            assert "tags" in response, f"{name} returned {response}"
+            assert isinstance(response["tags"], list)
@@ -0,0 +1,467 @@
+"""End-to-end validation tests shared by Ghost posts and pages."""
+
+import asyncio
+import json
+
+import pytest
+
+from ._lexical_fixtures import VALID_LEXICAL_DOC
+from ._validation_fixtures import (
+    LONG_191PLUS,
+    LONG_255PLUS,
+    LONG_300PLUS,
+    LONG_500PLUS,
+    LONG_META_DESC_POST,
+    LONG_META_TITLE_POST,
+    LONG_TAG_POST,
+    LONG_TITLE_POST,
+)
+from .conftest import BaseE2ETest
+
+# Invalid Lexical payloads, serialized once at import time
+_LEXICAL_BAD_NODE_TYPE = json.dumps({
+    "root": {
+        "children": [
+            {
+                "type": "invalid_node_type",
+                "version": 1,
+                "children": []
+            }
+        ],
+        "direction": "ltr",
+        "format": "",
+        "indent": 0,
+        "type": "root",
+        "version": 1
+    }
+})
+
+_LEXICAL_HEADING_NO_TAG = json.dumps({
+    "root": {
+        "children": [
+            {
+                "type": "heading",
+                "version": 1,
+                "children": [
+                    {
+                        "type": "text",
+                        "text": "Heading text",
+                        "version": 1
+                    }
+                ]
+                # Missing "tag" property for heading
+            }
+        ],
+        "direction": "ltr",
+        "format": "",
+        "indent": 0,
+        "type": "root",
+        "version": 1
+    }
+})
+
+_LEXICAL_LINK_NO_URL = json.dumps({
+    "root": {
+        "children": [
+            {
+                "type": "paragraph",
+                "version": 1,
+                "direction": "ltr",
+                "format": "",
+                "indent": 0,
+                "children": [
+                    {
+                        "type": "link",
+                        "text": "Link text",
+                        "version": 1
+                        # Missing "url" property for link
+                    }
+                ]
+            }
+        ],
+        "direction": "ltr",
+        "format": "",
+        "indent": 0,
+        "type": "root",
+        "version": 1
+    }
+})
+
+# Invalid create_post inputs: (kwargs, error tokens, context tokens), one id per case.
+# Tokens are checked by BaseE2ETest.assert_validation_error.
+INVALID_POST_CASES = [
+    pytest.param({"title": ""}, ("title", "required"), None, id="title_required"),
+    pytest.param({"title": LONG_TITLE_POST}, ("too long", "255"), None, id="title_too_long"),
+    pytest.param(
+        {"title": "Test Post", "status": "invalid_status"}, (("invalid", "status"),), (), id="invalid_status",
+    ),
+    pytest.param(
+        {"title": "Test Scheduled Post", "status": "scheduled"},
+        ("scheduled", "published_at"),
+        (),
+        id="scheduled_without_date",
+    ),
+    pytest.param(
+        {"title": "Test Post", "status": "scheduled", "published_at": "invalid-date-format"},
+        ("invalid", ("datetime", "format")),
+        ("ISO",),
+        id="invalid_published_at",
+    ),
+    pytest.param(
+        {"title": "Test Post", "content": "Some content", "content_format": "invalid_format"},
+        (("content format", "format"),),
+        (),
+        id="invalid_content_format",
+    ),
+    pytest.param(
+        {"title": "Test Post", "content": '{"root": {"invalid": json}}', "content_format": "lexical"},
+        ("json",),
+        (),
+        id="invalid_lexical_json",
+    ),
+    pytest.param(
+        {"title": "Test Post", "content": json.dumps({"notroot": {"children": []}}), "content_format": "lexical"},
+        ("root",),
+        (),
+        id="lexical_missing_root",
+    ),
+    pytest.param(
+        {
+            "title": "Test Post",
+            # Missing required properties like direction, format, indent, type, version
+            "content": json.dumps({"root": {"children": []}}),
+            "content_format": "lexical",
+        },
+        (("missing", "property"),),
+        (),
+        id="lexical_missing_required_props",
+    ),
+    pytest.param(
+        {"title": "Test Post", "content": _LEXICAL_BAD_NODE_TYPE, "content_format": "lexical"},
+        ("invalid", "type"),
+        None,
+        id="lexical_invalid_node_type",
+    ),
+    pytest.param(
+        {"title": "Test Post", "content": _LEXICAL_HEADING_NO_TAG, "content_format": "lexical"},
+        ("heading", "tag"),
+        None,
+        id="lexical_heading_without_tag",
+    ),
+    pytest.param(
+        {"title": "Test Post", "content": _LEXICAL_LINK_NO_URL, "content_format": "lexical"},
+        ("link", "url"),
+        None,
+        id="lexical_link_without_url",
+    ),
+    pytest.param(
+        {
+            "title": "Test Post",
+            "content": "<p>Unclosed paragraph<div>Nested div</p></div>",
+            "content_format": "html",
+        },
+        (("html", "tag", "validation"),),
+        None,
+        id="html_malformed",
+    ),
+    pytest.param(
+        {
+            "title": "Test Post",
+            "content": "<script>alert('xss')</script><custom-tag>Invalid</custom-tag>",
+            "content_format": "html",
+        },
+        ("invalid", "tag"),
+        None,
+        id="html_invalid_tags",
+    ),
+    pytest.param(
+        {"title": "Test Post", "meta_title": LONG_META_TITLE_POST},
+        ("meta title", "too long", "300"),
+        None,
+        id="meta_title_too_long",
+    ),
+    pytest.param(
+        {"title": "Test Post", "meta_description": LONG_META_DESC_POST},
+        ("meta description", "too long", "500"),
+        None,
+        id="meta_description_too_long",
+    ),
+    pytest.param(
+        {"title": "Test Post", "tags": f"valid-tag,{LONG_TAG_POST},another-valid-tag"},
+        ("tag", "too long", "191"),
+        None,
+        id="tag_name_too_long",
+    ),
+]
+
+
+# Invalid create_page inputs: (kwargs, error tokens, context tokens), one id per case.
+# Tokens are checked by BaseE2ETest.assert_validation_error.
+INVALID_PAGE_CASES = [
+    pytest.param({"title": ""}, ("title", ("required", "empty")), None, id="title_required"),
+    pytest.param({"title": LONG_255PLUS}, ("too long", "255"), None, id="title_too_long"),
+    pytest.param(
+        {"title": "Test Page", "status": "invalid_status"},
+        ("status",),
+        (("draft", "published"),),
+        id="invalid_status",
+    ),
+    pytest.param(
+        {"title": "Test Scheduled Page", "status": "scheduled"},
+        ("scheduled", "published_at"),
+        None,
+        id="scheduled_without_date",
+    ),
+    pytest.param(
+        {"title": "Test Scheduled Page", "status": "scheduled", "published_at": "invalid-date-format"},
+        (("datetime", "format"),),
+        None,
+        id="invalid_published_at",
+    ),
+    pytest.param(
+        {"title": "Test Page", "content": "Some content", "content_format": "invalid_format"},
+        ("content format",),
+        (("lexical", "html"),),
+        id="invalid_content_format",
+    ),
+    pytest.param(
+        {"title": "Test Page", "content": "{invalid json", "content_format": "lexical"},
+        ("json",),
+        None,
+        id="invalid_lexical_json",
+    ),
+    pytest.param(
+        {"title": "Test Page", "content": json.dumps({"no_root": {}}), "content_format": "lexical"},
+        ("root",),
+        None,
+        id="lexical_missing_root",
+    ),
+    pytest.param(
+        {
+            "title": "Test Page",
+            "content": json.dumps({
+                "root": {
+                    "children": []  # Missing other required properties
+                }
+            }),
+            "content_format": "lexical",
+        },
+        ("missing",),
+        None,
+        id="lexical_missing_required_props",
+    ),
+    pytest.param(
+        {"title": "Test Page", "content": _LEXICAL_BAD_NODE_TYPE, "content_format": "lexical"},
+        ("node type",),
+        None,
+        id="lexical_invalid_node_type",
+    ),
+    pytest.param(
+        {"title": "Test Page", "content": _LEXICAL_HEADING_NO_TAG, "content_format": "lexical"},
+        ("heading", "tag"),
+        None,
+        id="lexical_heading_without_tag",
+    ),
+    pytest.param(
+        {"title": "Test Page", "content": _LEXICAL_LINK_NO_URL, "content_format": "lexical"},
+        ("link", "url"),
+        None,
+        id="lexical_link_without_url",
+    ),
+    pytest.param(
+        {"title": "Test Page", "content": "<div><p>Unclosed div and paragraph tags", "content_format": "html"},
+        ("html", ("unclosed", "validation")),
+        None,
+        id="html_malformed",
+    ),
+    pytest.param(
+        {
+            "title": "Test Page",
+            "content": "<script>alert('xss')</script><p>Valid paragraph</p>",
+            "content_format": "html",
+        },
+        ("html", ("invalid", "tag")),
+        None,
+        id="html_invalid_tags",
+    ),
+    pytest.param(
+        {"title": "Test Page", "meta_title": LONG_300PLUS},
+        ("meta title", "300"),
+        None,
+        id="meta_title_too_long",
+    ),
+    pytest.param(
+        {"title": "Test Page", "meta_description": LONG_500PLUS},
+        ("meta description", "500"),
+        None,
+        id="meta_description_too_long",
+    ),
+    pytest.param(
+        {"title": "Test Page", "tags": f"valid_tag,{LONG_191PLUS}"},
+        ("tag name", "191"),
+        None,
+        id="tag_name_too_long",
+    ),
+]
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize test_invalid_inputs over the case table of its suite class."""
+    if metafunc.function.__name__ == "test_invalid_inputs":
+        metafunc.parametrize(("kwargs", "err_tokens", "ctx_tokens"), metafunc.cls.INVALID_CASES)
+
+
+class _ValidationSuite(BaseE2ETest):
+    """Validation tests common to posts and pages, configured by class attributes."""
+
+    TOOL_CREATE: str
+    CONTAINER_KEY: str
+    TRACK_KEY: str
+    INVALID_CASES: list
+    VALID_CREATE_KWARGS: dict
+
+    async def test_invalid_inputs(self, mcp_server, kwargs, err_tokens, ctx_tokens):
+        """Test that invalid inputs are rejected with a descriptive error."""
+        response = await self.call_mcp_tool_json(mcp_server, self.TOOL_CREATE, **kwargs)
+        self.assert_validation_error(response, err_tokens, ctx_tokens)
+
+    @pytest.mark.fast
+    async def test_invalid_inputs_batch(self, mcp_server):
+        """Test every invalid case in one test, running the calls concurrently."""
+        responses = await asyncio.gather(
+            *(self.call_mcp_tool_json(mcp_server, self.TOOL_CREATE, **case.values[0]) for case in self.INVALID_CASES)
+        )
+        for case, response in zip(self.INVALID_CASES, responses):
+            _, err_tokens, ctx_tokens = case.values
+            self.assert_validation_error(response, err_tokens, ctx_tokens, case_id=case.id)
+
+    async def test_validate_successful_creation_with_valid_data(self, mcp_server, cleanup_test_content):
+        """Test that properly formatted content passes validation."""
+        response = await self.call_mcp_tool_json(mcp_server, self.TOOL_CREATE, **self.VALID_CREATE_KWARGS)
+
+        # Should succeed without errors
+        assert "error" not in response
+        assert self.CONTAINER_KEY in response
+        item = response[self.CONTAINER_KEY][0]
+        assert item["title"] == self.VALID_CREATE_KWARGS["title"]
+        assert item["status"] == "draft"
+
+        # Track for cleanup
+        cleanup_test_content[self.TRACK_KEY](item["id"])
+
+
+@pytest.mark.e2e
+@pytest.mark.admin
+class TestPostValidationE2E(_ValidationSuite):
+    """Test post validation functionality end-to-end."""
+
+    TOOL_CREATE = "create_post"
+    CONTAINER_KEY = "posts"
+    TRACK_KEY = "track_post"
+    INVALID_CASES = INVALID_POST_CASES
+    VALID_CREATE_KWARGS = {
+        "title": "Valid Test Post",
+        "content": VALID_LEXICAL_DOC,
+        "content_format": "lexical",
+        "status": "draft",
+        "excerpt": "Test excerpt",
+        "featured": False,
+        "meta_title": "Valid Meta Title",
+        "meta_description": "Valid meta description",
+        "tags": "test,validation,success",
+    }
+
+    async def test_validate_update_post_validation(self, mcp_server, sample_post):
+        """Test that update_post also validates input properly."""
+        # Test with invalid status
+        response = await self.call_mcp_tool_json(
+            mcp_server, "update_post",
+            post_id=sample_post["id"],
+            status="invalid_status"
+        )
+
+        self.assert_validation_error(response, (("invalid", "status"),))
+
+    async def test_validate_error_response_structure(self, mcp_server):
+        """Test that validation errors return proper structure with examples."""
+        response = await self.call_mcp_tool_json(
+            mcp_server, "create_post",
+            title="",  # Invalid title
+            content_format="invalid"  # Invalid format
+        )
+
+        # Verify error response structure
+        assert "error" in response
+        assert "context" in response or "examples" in response
+
+        # Should include examples for content formats
+        if "examples" in response:
+            examples = response["examples"]
+            assert "lexical_simple" in examples
+            assert "html_simple" in examples
+
+
+@pytest.mark.e2e
+@pytest.mark.admin
+class TestPageValidationE2E(_ValidationSuite):
+    """Test page validation functionality end-to-end."""
+
+    TOOL_CREATE = "create_page"
+    CONTAINER_KEY = "pages"
+    TRACK_KEY = "track_page"
+    INVALID_CASES = INVALID_PAGE_CASES
+    VALID_CREATE_KWARGS = {
+        "title": "Valid Test Page",
+        "content": VALID_LEXICAL_DOC,
+        "content_format": "lexical",
+        "status": "draft",
+        "excerpt": "A test page excerpt",
+        "featured": True,
+        "tags": "test,validation",
+        "meta_title": "SEO Page Title",
+        "meta_description": "SEO page description",
+    }
+
+    async def test_validate_update_page_validation(self, mcp_server, cleanup_test_content):
+        """Test validation during page updates."""
+        # First create a valid page
+        response = await self.call_mcp_tool_json(
+            mcp_server, "create_page",
+            title="Original Page",
+            status="draft"
+        )
+        page_id = response["pages"][0]["id"]
+
+        # Track for cleanup
+        cleanup_test_content["track_page"](page_id)
+
+        # Try to update with invalid data
+        update_response = await self.call_mcp_tool_json(
+            mcp_server, "update_page",
+            page_id=page_id,
+            title=LONG_255PLUS,  # Too long
+        )
+
+        self.assert_validation_error(update_response, ("too long",))
+
+        # Try valid update
+        valid_update_response = await self.call_mcp_tool_json(
+            mcp_server, "update_page",
+            page_id=page_id,
+            title="Updated Valid Page"
+        )
+
+        assert "error" not in valid_update_response
+        assert valid_update_response["pages"][0]["title"] == "Updated Valid Page"
+
+    async def test_validate_error_response_structure(self, mcp_server):
+        """Test that validation errors have consistent response structure."""
+        response = await self.call_mcp_tool_json(mcp_server, "create_page", title="")
+
+        # All validation errors should have error and context fields
+        assert "error" in response
+        assert "context" in response
+        assert isinstance(response["error"], str)
+        assert isinstance(response["context"], str)
+        assert len(response["error"]) > 0
+        assert len(response["context"]) > 0
@@ -1,29 +1,72 @@
 """Tests for Ghost API client."""
 
+import httpx
 import pytest
-from unittest.mock import AsyncMock, patch
 
-from ghost_mcp.client import GhostClient
+from ghost_mcp.auth import AdminAuth, admin_auth
+from ghost_mcp.client import GhostClient, set_shared_http_client
 from ghost_mcp.config import config
 
 
 class TestGhostClient:
     """Test Ghost API client."""
 
-    def test_client_initialization(self):
+    @pytest.fixture(scope="class")
+    async def client(self):
+        """Provide one default GhostClient shared by the read-only tests in this class."""
+        async with GhostClient() as client:
+            yield client
+
+    def test_client_initialization(self, client):
         """Test client initialization."""
-        client = GhostClient()
         assert client.base_url.endswith("/")
         assert client.timeout == config.ghost.timeout
 
-    def test_build_url(self):
-        """Test URL building."""
-        client = GhostClient()
-        url = client._build_url("posts/", "content")
-        assert url.endswith("ghost/api/content/posts/")
-
-    def test_build_admin_url(self):
-        """Test Admin API URL building."""
-        client = GhostClient()
-        url = client._build_url("posts/", "admin")
-        assert url.endswith("ghost/api/admin/posts/")
\ No newline at end of file
+    @pytest.mark.parametrize(
+        ("api_type", "suffix"),
+        [
+            pytest.param("content", "ghost/api/content/posts/", id="content"),
+            pytest.param("admin", "ghost/api/admin/posts/", id="admin"),
+        ],
+    )
+    def test_build_url(self, client, api_type, suffix):
+        """Test URL building for the Content and Admin APIs."""
+        assert client._build_url("posts/", api_type).endswith(suffix)
+
+    @pytest.fixture
+    def no_shared_http_client(self):
+        """Clear the shared HTTP client for one test, restoring it afterwards."""
+        previous = set_shared_http_client(None)
+        yield
+        set_shared_http_client(previous)
+
+    async def test_close_leaves_borrowed_http_client_open(self, no_shared_http_client):
+        """Test that closing a client only closes the HTTP client it created."""
+        async with httpx.AsyncClient() as http_client:
+            async with GhostClient(http_client=http_client) as borrowing:
+                assert borrowing.client is http_client
+            assert not http_client.is_closed
+
+        async with GhostClient() as owning:
+            assert owning._owns_client
+        assert owning.client.is_closed
+
+
+class TestAdminAuth:
+    """Test Admin API authentication shared between clients."""
+
+    def test_admin_token_shared_between_handlers(self, monkeypatch):
+        """Test that handlers with the same Admin API key reuse one JWT token."""
+        # Use a fresh token cache; monkeypatch restores the process-wide one afterwards
+        monkeypatch.setattr(admin_auth, "_token_cache", {})
+
+        admin_api_key = "a" * 24 + ":" + "b" * 64
+        first = AdminAuth(admin_api_key)
+        second = AdminAuth(admin_api_key)
+
+        token = first.get_auth_headers()["Authorization"]
+        assert second.get_auth_headers()["Authorization"] == token
+
+        second.invalidate_cache()
+        assert second._cached_token is None
+        assert admin_api_key not in admin_auth._token_cache
@@ -0,0 +1,121 @@
+"""Tests for post and page content validators."""
+
+import json
+
+import pytest
+
+from ghost_mcp.types.errors import ValidationError
+from ghost_mcp.utils.content_validation import (
+    validate_content,
+    validate_meta_description,
+    validate_meta_title,
+    validate_published_at,
+    validate_status,
+    validate_title,
+)
+
+_ROOT_PROPS = {"direction": "ltr", "format": "", "indent": 0, "type": "root", "version": 1}
+
+# Invalid inputs: (id, validator, args, substrings expected in the lowercased error)
+INVALID_INPUT_CASES = [
+    ("title_required", validate_title, ("",), ("title", "required")),
+    ("title_too_long", validate_title, ("A" * 300,), ("too long", "255")),
+    ("invalid_status", validate_status, ("invalid_status",), ("invalid", "status")),
+    ("invalid_published_at", validate_published_at, ("invalid-date-format",), ("invalid", "datetime")),
+    ("invalid_content_format", validate_content, ("Some content", "invalid_format"), ("content format",)),
+    ("invalid_lexical_json", validate_content, ('{"root": {"invalid": json}}', "lexical"), ("json",)),
+    (
+        "lexical_missing_root",
+        validate_content,
+        (json.dumps({"notroot": {"children": []}}), "lexical"),
+        ("root",),
+    ),
+    (
+        "lexical_missing_required_props",
+        validate_content,
+        (json.dumps({"root": {"children": []}}), "lexical"),
+        ("missing", "property"),
+    ),
+    (
+        "lexical_invalid_node_type",
+        validate_content,
+        (
+            json.dumps({"root": {"children": [{"type": "invalid_node_type", "version": 1}], **_ROOT_PROPS}}),
+            "lexical",
+        ),
+        ("invalid", "node type"),
+    ),
+    (
+        "lexical_heading_without_tag",
+        validate_content,
+        (
+            json.dumps({"root": {"children": [{"type": "heading", "version": 1, "children": []}], **_ROOT_PROPS}}),
+            "lexical",
+        ),
+        ("heading", "tag"),
+    ),
+    (
+        "lexical_link_without_url",
+        validate_content,
+        (
+            json.dumps({
+                "root": {
+                    "children": [
+                        {
+                            "type": "paragraph",
+                            "version": 1,
+                            "children": [{"type": "link", "text": "Link text", "version": 1}],
+                        }
+                    ],
+                    **_ROOT_PROPS,
+                }
+            }),
+            "lexical",
+        ),
+        ("link", "url"),
+    ),
+    (
+        "html_malformed",
+        validate_content,
+        ("<div><p>Unclosed div and paragraph tags", "html"),
+        ("html", "unclosed"),
+    ),
+    (
+        "html_invalid_tags",
+        validate_content,
+        ("<script>alert('xss')</script><p>Valid paragraph</p>", "html"),
+        ("html", "invalid", "tag"),
+    ),
+    ("meta_title_too_long", validate_meta_title, ("A" * 301,), ("meta title", "too long", "300")),
+    (
+        "meta_description_too_long",
+        validate_meta_description,
+        ("A" * 501,),
+        ("meta description", "too long", "500"),
+    ),
+]
+
+
+class TestContentValidation:
+    """Test content validators without going through the MCP tools."""
+
+    @pytest.mark.parametrize("case", INVALID_INPUT_CASES, ids=[case[0] for case in INVALID_INPUT_CASES])
+    def test_invalid_inputs(self, case):
+        """Test that invalid inputs raise a ValidationError with a descriptive message."""
+        _, validator, args, err_tokens = case
+        with pytest.raises(ValidationError) as exc_info:
+            validator(*args)
+
+        error = str(exc_info.value).lower()
+        for token in err_tokens:
+            assert token in error
+        assert exc_info.value.context
+
+    def test_valid_inputs(self):
+        """Test that valid inputs are returned normalized."""
+        assert validate_title("  My Post  ") == "My Post"
+        assert validate_status("Draft") == "draft"
+        assert validate_published_at("2024-01-01T10:00:00.000Z") == "2024-01-01T10:00:00.000Z"
+        assert validate_content("<p>Hello</p>", "html") == "<p>Hello</p>"
+        lexical = validate_content(json.dumps({"root": {"children": [], **_ROOT_PROPS}}), "lexical")
+        assert lexical["root"]["type"] == "root"
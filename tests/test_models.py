@@ -1,59 +1,81 @@
 """Tests for Ghost MCP models and types."""
 
 import pytest
-from pydantic import ValidationError
 
-from ghost_mcp.types.ghost import GhostPost, PostStatus, VisibilityType
+from ghost_mcp.types.ghost import PostStatus, VisibilityType
 from ghost_mcp.types.errors import GhostMCPError, ErrorCategory
 from ghost_mcp.config import GhostConfig, LogLevel
 
 
+@pytest.fixture(scope="session")
+def default_ghost_config():
+    """Build the default Ghost configuration once for the whole session."""
+    return GhostConfig()
+
+
 class TestGhostModels:
     """Test Ghost data models."""
 
-    def test_post_status_enum(self):
-        """Test post status enumeration."""
-        assert PostStatus.DRAFT == "draft"
-        assert PostStatus.PUBLISHED == "published"
-        assert PostStatus.SCHEDULED == "scheduled"
-
-    def test_visibility_enum(self):
-        """Test visibility enumeration."""
-        assert VisibilityType.PUBLIC == "public"
-        assert VisibilityType.MEMBERS == "members"
+    @pytest.mark.parametrize(
+        "member,expected",
+        [
+            (PostStatus.DRAFT, "draft"),
+            (PostStatus.PUBLISHED, "published"),
+            (PostStatus.SCHEDULED, "scheduled"),
+            (VisibilityType.PUBLIC, "public"),
+            (VisibilityType.MEMBERS, "members"),
+            (LogLevel.INFO, "info"),
+            (LogLevel.DEBUG, "debug"),
+            (LogLevel.ERROR, "error"),
+        ],
+    )
+    def test_enum_values(self, member, expected):
+        """Test post status, visibility and log level enumerations."""
+        assert member == expected
 
 
 class TestErrorModels:
     """Test error models."""
 
-    def test_ghost_mcp_error(self):
+    @pytest.fixture(
+        scope="class",
+        params=[
+            pytest.param((ErrorCategory.NETWORK, None), id="network"),
+            pytest.param((ErrorCategory.VALIDATION, "TEST_001"), id="validation-with-code"),
+        ],
+    )
+    def error_case(self, request):
+        """Build one error per scenario, shared by the attribute and serialization tests."""
+        category, code = request.param
+        error = GhostMCPError("Test error", category, code=code)
+        return error, category, code
+
+    def test_ghost_mcp_error(self, error_case):
         """Test base error class."""
-        error = GhostMCPError("Test error", ErrorCategory.NETWORK)
-        assert error.category == ErrorCategory.NETWORK
+        error, category, code = error_case
+        assert error.category == category
+        assert error.code == code
         assert str(error) == "Test error"
         assert error.id is not None
 
-    def test_error_to_dict(self):
+    def test_error_to_dict(self, error_case):
         """Test error serialization."""
-        error = GhostMCPError("Test error", ErrorCategory.VALIDATION, code="TEST_001")
+        error, category, code = error_case
         error_dict = error.to_dict()
         assert error_dict["message"] == "Test error"
-        assert error_dict["category"] == "VALIDATION"
-        assert error_dict["code"] == "TEST_001"
+        # Serialized as the plain value, not the str-enum member
+        assert error_dict["category"] == category.value
+        assert type(error_dict["category"]) is str
+        assert error_dict["code"] == code
+        assert error_dict["id"] == error.id
 
 
 class TestConfig:
     """Test configuration models."""
 
-    def test_ghost_config_defaults(self):
+    def test_ghost_config_defaults(self, default_ghost_config):
         """Test Ghost configuration defaults."""
-        config = GhostConfig()
+        config = default_ghost_config
         assert str(config.url) == "http://localhost:2368"
         assert config.version == "v5.0"
         assert config.timeout == 30
-
-    def test_log_level_enum(self):
-        """Test log level enumeration."""
-        assert LogLevel.INFO == "info"
-        assert LogLevel.DEBUG == "debug"
-        assert LogLevel.ERROR == "error"
\ No newline at end of file
@@ -0,0 +1,67 @@
+"""Tests for settings tools against canned Ghost API responses."""
+
+import json
+
+import httpx
+import pytest
+
+from ghost_mcp.client import set_shared_http_client
+from ghost_mcp.config import config
+from ghost_mcp.tools.content.settings import get_settings, get_site_info
+
+CANNED_SETTINGS = {
+    "settings": {
+        "title": "Ghost MCP Test Site",
+        "description": "Canned settings for unit tests",
+        "url": "http://localhost:2368/",
+        "logo": None,
+        "icon": None,
+        "cover_image": None,
+        "accent_color": "#FF1A75",
+        "timezone": "Etc/UTC",
+        "locale": "en",
+        "lang": "en",
+        "version": "5.0",
+    },
+    "meta": {},
+}
+
+
+@pytest.fixture
+async def canned_ghost(monkeypatch):
+    """Serve canned settings through the shared HTTP client and record requests."""
+    monkeypatch.setattr(config.ghost, "content_api_key", "0" * 26)
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json=CANNED_SETTINGS)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        # Restore any shared client installed by the e2e fixtures afterwards
+        previous = set_shared_http_client(client)
+        yield requests
+        set_shared_http_client(previous)
+
+
+class TestSettingsTools:
+    """Test settings tools without a running Ghost instance."""
+
+    async def test_get_settings(self, canned_ghost):
+        """Test that settings are fetched from the Content API and returned as-is."""
+        response = json.loads(await get_settings())
+
+        assert response == CANNED_SETTINGS
+        assert len(canned_ghost) == 1
+        assert canned_ghost[0].url.path == "/ghost/api/content/settings/"
+        assert canned_ghost[0].url.params["key"] == "0" * 26
+
+    async def test_get_site_info(self, canned_ghost):
+        """Test that site info is extracted from the settings response."""
+        response = json.loads(await get_site_info())
+
+        site = response["site_info"]
+        assert site["title"] == CANNED_SETTINGS["settings"]["title"]
+        assert site["url"] == CANNED_SETTINGS["settings"]["url"]
+        assert site["version"] == "5.0"
+        assert "locale" not in site